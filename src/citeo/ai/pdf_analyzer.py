@@ -3,6 +3,7 @@
 Downloads and analyzes PDF content for in-depth paper analysis.
 """
 
+import asyncio
 import tempfile
 from pathlib import Path
 
@@ -122,8 +123,10 @@ async def analyze_pdf(arxiv_id: str, pdf_url: str) -> str:
     pdf_content = await download_pdf(pdf_url)
 
     # Extract text
+    # Reason: PyMuPDF parsing and temp-file I/O are blocking; run them in a worker
+    # thread so long PDFs don't stall the API event loop
     log.info("Extracting text from PDF")
-    pdf_text = extract_text_from_pdf(pdf_content)
+    pdf_text = await asyncio.to_thread(extract_text_from_pdf, pdf_content)
     log.info("Text extracted", text_length=len(pdf_text))
 
     # Analyze with AI
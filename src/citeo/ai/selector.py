@@ -4,6 +4,8 @@ Uses AI agent to select the most valuable papers when multiple papers
 have similar high scores, ensuring diversity, novelty, and complementarity.
 """
 
+import logging
+
 import structlog
 from agents import Runner
 
@@ -65,15 +67,17 @@ async def select_papers(
         selected_papers = _reorder_papers(papers, output)
 
         # Log selection reasoning for observability
-        for paper in selected_papers:
-            reason = output.selection_reasoning.get(paper.arxiv_id, "未提供理由")
-            logger.debug(
-                "Paper selected",
-                arxiv_id=paper.arxiv_id,
-                title=paper.title[:50],
-                score=paper.summary.relevance_score if paper.summary else 0,
-                reason=reason,
-            )
+        # Reason: Skip the per-paper lookups and slicing when debug is filtered out
+        if logger.is_enabled_for(logging.DEBUG):
+            for paper in selected_papers:
+                reason = output.selection_reasoning.get(paper.arxiv_id, "未提供理由")
+                logger.debug(
+                    "Paper selected",
+                    arxiv_id=paper.arxiv_id,
+                    title=paper.title[:50],
+                    score=paper.summary.relevance_score if paper.summary else 0,
+                    reason=reason,
+                )
 
         return selected_papers
 
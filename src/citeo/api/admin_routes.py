@@ -3,7 +3,6 @@
 Provides an authenticated HTML page for viewing papers and retrying AI processing.
 """
 
-import re
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -12,7 +11,12 @@ from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
 from citeo.ai.summarizer import summarize_paper
-from citeo.api.routes import get_pdf_service, get_storage
+from citeo.api.routes import (
+    ArxivIdPath,
+    get_pdf_service,
+    get_storage,
+    invalidate_paper_cache,
+)
 from citeo.auth.dependencies import require_auth
 from citeo.auth.models import AuthUser
 from citeo.exceptions import AIProcessingError
@@ -24,11 +28,6 @@ _templates_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(_templates_dir))
 
 
-def _validate_arxiv_id(arxiv_id: str) -> bool:
-    pattern = r"^(\d{4}\.\d{4,5}|[a-z\-]+/\d{7})$"
-    return bool(re.match(pattern, arxiv_id, re.IGNORECASE))
-
-
 def _get_fetched_day_range(date_str: str | None) -> tuple[datetime, datetime]:
     day = datetime.strptime(date_str, "%Y-%m-%d") if date_str else datetime.utcnow()
     start = day.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -67,15 +66,9 @@ async def admin_papers_page(
 
 @admin_api_router.post("/{arxiv_id}/retry-summary")
 async def retry_summary(
-    arxiv_id: str,
+    arxiv_id: ArxivIdPath,
     user: AuthUser = Depends(require_auth),
 ) -> dict[str, str]:
-    if not _validate_arxiv_id(arxiv_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid arXiv ID format: {arxiv_id}",
-        )
-
     storage = get_storage()
     paper = await storage.get_paper_by_arxiv_id(arxiv_id)
     if not paper:
@@ -87,6 +80,7 @@ async def retry_summary(
     try:
         summary = await summarize_paper(paper)
         await storage.update_summary(paper.guid, summary)
+        invalidate_paper_cache(arxiv_id)
     except AIProcessingError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -102,15 +96,9 @@ async def retry_summary(
 
 @admin_api_router.post("/{arxiv_id}/retry-analysis")
 async def retry_analysis(
-    arxiv_id: str,
+    arxiv_id: ArxivIdPath,
     user: AuthUser = Depends(require_auth),
 ) -> dict[str, str]:
-    if not _validate_arxiv_id(arxiv_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid arXiv ID format: {arxiv_id}",
-        )
-
     storage = get_storage()
     paper = await storage.get_paper_by_arxiv_id(arxiv_id)
     if not paper:
@@ -124,6 +112,7 @@ async def retry_analysis(
         force=True,
         skip_notification=True,
     )
+    invalidate_paper_cache(arxiv_id)
 
     if result["status"] == "error":
         raise HTTPException(
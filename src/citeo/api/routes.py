@@ -3,17 +3,25 @@
 Provides REST API endpoints for PDF analysis and paper queries.
 """
 
+import asyncio
+import hashlib
 import re
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from typing import Annotated, Any
 
-import markdown
 import structlog
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
-from fastapi.responses import HTMLResponse, PlainTextResponse
+from fastapi import Path as PathParam
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
+from citeo import __version__
 from citeo.auth.dependencies import require_auth
 from citeo.auth.exceptions import RateLimitExceededError
 from citeo.auth.models import AuthUser
@@ -23,11 +31,17 @@ from citeo.auth.rate_limiter import (
     get_analyze_rate_limiter,
 )
 from citeo.auth.signed_url import get_url_generator
-from citeo.config.settings import Settings
+from citeo.config.settings import Settings, settings
+from citeo.models.paper import Paper
 from citeo.notifiers.base import Notifier
 from citeo.notifiers.factory import create_notifier
+from citeo.notifiers.feishu import FeishuNotifier
+from citeo.notifiers.multi import MultiNotifier
+from citeo.notifiers.telegram import TelegramNotifier
+from citeo.services.paper_service import PaperService
 from citeo.services.pdf_service import PDFService
 from citeo.storage import PaperStorage, create_storage
+from citeo.utils.markdown_html import render_markdown_html
 
 logger = structlog.get_logger()
 
@@ -38,10 +52,28 @@ router = APIRouter(prefix="/api", tags=["papers"])
 _templates_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(_templates_dir))
 
+# arXiv ID format: YYMM.NNNNN (optional vN suffix) or archive/YYMMNNN
+# Reason: Reject malformed IDs at the routing layer before they reach storage
+_ARXIV_ID_PATTERN = r"^(\d{4}\.\d{4,5}(v\d+)?|[a-zA-Z\-]+/\d{7})$"
+_ARXIV_ID_RE = re.compile(_ARXIV_ID_PATTERN)
+
+ArxivIdPath = Annotated[
+    str,
+    PathParam(pattern=_ARXIV_ID_PATTERN, description="arXiv paper ID (e.g., 2512.14709)"),
+]
+
 # Service instances (will be initialized on app startup)
 _storage: PaperStorage | None = None
 _pdf_service: PDFService | None = None
 _notifier: Notifier | None = None
+_min_notification_score: float = settings.min_notification_score
+
+# Platform notifier lookup tables (built once in init_services)
+# Reason: Signed-URL callbacks resolve the triggering notifier per request;
+# precomputing avoids walking MultiNotifier with isinstance checks each time.
+_notifiers_by_id: dict[str, Notifier] = {}
+_notifiers_by_platform: dict[str, Notifier] = {}
+_notifier_channel_count: int = 0
 
 
 def init_services(settings: Settings) -> None:
@@ -52,14 +84,13 @@ def init_services(settings: Settings) -> None:
     Args:
         settings: Application settings.
     """
-    global _storage, _pdf_service, _notifier
+    global _storage, _pdf_service, _notifier, _min_notification_score
     _storage = create_storage(settings)
+    _min_notification_score = settings.min_notification_score
 
     # Initialize URL generator if configured
     url_generator = None
     try:
-        from citeo.auth.signed_url import get_url_generator
-
         url_generator = get_url_generator()
         logger.info("URL generator initialized for API services")
     except ValueError as e:
@@ -106,9 +137,45 @@ def init_services(settings: Settings) -> None:
         logger.warning("Failed to create notifier", error=str(e))
         _notifier = None
 
+    _build_platform_notifier_maps(_notifier)
     _pdf_service = PDFService(_storage, notifier=_notifier)
 
 
+async def close_services() -> None:
+    """Release network resources held by the API services."""
+    if _notifier is not None:
+        await _notifier.close()
+
+
+def _build_platform_notifier_maps(notifier: Notifier | None) -> None:
+    """Index notifier instances by notifier_id and by platform, and count channels.
+
+    Args:
+        notifier: Configured notifier (single or MultiNotifier), or None.
+
+    Reason: The platform map keeps the first notifier of each type, matching
+    the previous fallback order when notifier_id is absent or unknown.
+    """
+    global _notifier_channel_count
+    _notifiers_by_id.clear()
+    _notifiers_by_platform.clear()
+    _notifier_channel_count = 0
+
+    if notifier is None:
+        return
+
+    members = notifier._notifiers if isinstance(notifier, MultiNotifier) else [notifier]
+    _notifier_channel_count = len(members)
+    for n in members:
+        notifier_id = getattr(n, "_notifier_id", None)
+        if notifier_id:
+            _notifiers_by_id.setdefault(notifier_id, n)
+        if isinstance(n, TelegramNotifier):
+            _notifiers_by_platform.setdefault("telegram", n)
+        elif isinstance(n, FeishuNotifier):
+            _notifiers_by_platform.setdefault("feishu", n)
+
+
 def get_pdf_service() -> PDFService:
     """Get PDF service instance."""
     if _pdf_service is None:
@@ -123,6 +190,23 @@ def get_storage() -> PaperStorage:
     return _storage
 
 
+def get_paper_service(request: Request) -> PaperService:
+    """Get the paper service created during app lifespan startup.
+
+    Reason: Exposed as a FastAPI dependency so tests can override it.
+
+    Raises:
+        HTTPException 503: Paper service not available.
+    """
+    paper_service: PaperService | None = getattr(request.app.state, "paper_service", None)
+    if paper_service is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Paper service not available. Ensure API started with scheduler.",
+        )
+    return paper_service
+
+
 def get_notifier() -> Notifier | None:
     """Get notifier instance.
 
@@ -134,23 +218,36 @@ def get_notifier() -> Notifier | None:
 
 # Helper functions for date handling
 
+# Offset from midnight to the last microsecond of the same day
+_END_OF_DAY = timedelta(days=1, microseconds=-1)
+
+# Cached (utc_day_number, start, end) for _get_today_range
+_today_cache: tuple[int, datetime, datetime] | None = None
+
 
 def _get_today_range() -> tuple[datetime, datetime]:
     """Get today's date range (00:00:00 to 23:59:59 UTC).
 
     Reason: Centralized date range calculation for default queries.
+    The range only changes at UTC midnight, so it is cached per day.
     """
-    now_utc = datetime.utcnow()
-    start = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
-    end = start + timedelta(days=1)
-    return start, end
+    global _today_cache
+    day = int(time.time()) // 86400
+    if _today_cache is None or _today_cache[0] != day:
+        start = datetime.fromtimestamp(day * 86400, UTC).replace(tzinfo=None)
+        _today_cache = (day, start, start + timedelta(days=1))
+    return _today_cache[1], _today_cache[2]
 
 
+@lru_cache(maxsize=512)
 def _parse_date(date_str: str) -> datetime:
     """Parse date string to datetime object (UTC).
 
     Supports: YYYY-MM-DD, ISO 8601.
     Raises: ValueError if invalid format.
+
+    Reason: Clients poll the same few dates repeatedly; results are immutable
+    datetimes, so memoizing skips strptime on repeat queries.
     """
     try:
         if len(date_str) == 10:  # YYYY-MM-DD
@@ -210,8 +307,8 @@ def _validate_date_params(
                 detail="'start_date' must be before or equal to 'end_date'",
             )
 
-        # Extend end_dt to end of day
-        end_dt = end_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
+        # Extend end_dt to end of day (23:59:59.999999)
+        end_dt = end_dt.replace(hour=0, minute=0, second=0, microsecond=0) + _END_OF_DAY
         return start_dt, end_dt
 
     # Default: today
@@ -221,12 +318,6 @@ def _validate_date_params(
 # Request/Response models
 
 
-class AnalyzeRequest(BaseModel):
-    """Request to analyze a paper's PDF."""
-
-    arxiv_id: str = Field(..., description="arXiv paper ID (e.g., 2512.14709)")
-
-
 class AnalyzeResponse(BaseModel):
     """Response from PDF analysis."""
 
@@ -315,10 +406,6 @@ class TriggerDailyTaskResponse(BaseModel):
     errors: list[str] = Field(default_factory=list, description="Error messages if any")
 
 
-# Background task storage
-_analysis_tasks: dict[str, str] = {}  # arxiv_id -> status
-
-
 async def check_analyze_rate_limit(user: AuthUser = Depends(require_auth)) -> AuthUser:
     """Check rate limit for analyze endpoint.
 
@@ -336,19 +423,33 @@ async def check_analyze_rate_limit(user: AuthUser = Depends(require_auth)) -> Au
     return user
 
 
+async def _set_analysis_status(arxiv_id: str, task_status: str) -> None:
+    """Record background analysis status in shared storage.
+
+    Reason: Status lives in storage (not process memory) so every API worker
+    sees in-flight analyses. A failed status write must not abort the analysis.
+    """
+    try:
+        await get_storage().set_analysis_status(arxiv_id, task_status)
+    except Exception as e:
+        logger.warning("Failed to record analysis status", arxiv_id=arxiv_id, error=str(e))
+
+
 async def _run_analysis_background(arxiv_id: str, force: bool = False) -> None:
     """Run PDF analysis in background.
 
     Args:
         arxiv_id: arXiv paper ID.
         force: If True, force re-analysis even if cached.
+
+    Reason: The route marks the task "processing" before scheduling it.
     """
-    _analysis_tasks[arxiv_id] = "processing"
     try:
         result = await get_pdf_service().analyze_paper(arxiv_id, force=force)
-        _analysis_tasks[arxiv_id] = result.get("status", "completed")
+        invalidate_paper_cache(arxiv_id)
+        await _set_analysis_status(arxiv_id, result.get("status", "completed"))
     except Exception as e:
-        _analysis_tasks[arxiv_id] = f"error: {e}"
+        await _set_analysis_status(arxiv_id, f"error: {e}")
 
 
 async def _run_analysis_background_with_platform(
@@ -364,9 +465,8 @@ async def _run_analysis_background_with_platform(
         notifier_id: Optional unique notifier instance ID for precise matching.
 
     Reason: Isolate notifications to the triggering platform only.
+    The route marks the task "processing" before scheduling it.
     """
-    _analysis_tasks[arxiv_id] = "processing"
-
     try:
         # Get services
         pdf_service = get_pdf_service()
@@ -374,8 +474,9 @@ async def _run_analysis_background_with_platform(
 
         # Perform analysis without sending notification in service
         result = await pdf_service.analyze_paper(arxiv_id, force=force, skip_notification=True)
+        invalidate_paper_cache(arxiv_id)
 
-        _analysis_tasks[arxiv_id] = result.get("status", "completed")
+        await _set_analysis_status(arxiv_id, result.get("status", "completed"))
 
         # Reason: If analysis returned an error status, reset nonce so user can retry
         if result["status"] == "error" and nonce:
@@ -403,7 +504,7 @@ async def _run_analysis_background_with_platform(
                     )
 
     except Exception as e:
-        _analysis_tasks[arxiv_id] = f"error: {e}"
+        await _set_analysis_status(arxiv_id, f"error: {e}")
         logger.error(
             "Background analysis failed",
             arxiv_id=arxiv_id,
@@ -445,52 +546,55 @@ def _get_platform_notifier(platform: str, notifier_id: str | None = None) -> Not
     When notifier_id is provided, match the exact instance;
     otherwise fall back to first matching platform type.
     """
-    if not _notifier:
-        return None
-
-    # Import notifier types
-    from citeo.notifiers.feishu import FeishuNotifier
-    from citeo.notifiers.multi import MultiNotifier
-    from citeo.notifiers.telegram import TelegramNotifier
-
-    # If _notifier is MultiNotifier, extract the specific notifier
-    if isinstance(_notifier, MultiNotifier):
-        for n in _notifier._notifiers:
-            if notifier_id and hasattr(n, "_notifier_id") and n._notifier_id == notifier_id:
-                return n
-        # Fallback: match by platform type if notifier_id not found
-        for n in _notifier._notifiers:
-            if platform == "telegram" and isinstance(n, TelegramNotifier):
-                return n
-            elif platform == "feishu" and isinstance(n, FeishuNotifier):
-                return n
-        return None
-    else:
-        # Single notifier - check if it matches
-        if notifier_id and hasattr(_notifier, "_notifier_id") and _notifier._notifier_id == notifier_id:
-            return _notifier
-        if platform == "telegram" and isinstance(_notifier, TelegramNotifier):
-            return _notifier
-        elif platform == "feishu" and isinstance(_notifier, FeishuNotifier):
-            return _notifier
-        return None
+    if notifier_id:
+        notifier = _notifiers_by_id.get(notifier_id)
+        if notifier is not None:
+            return notifier
+    return _notifiers_by_platform.get(platform)
+
+
+def _to_list_item(paper: Paper) -> dict[str, Any]:
+    """Build a list item dict (PaperListItemResponse shape) from a stored paper.
+
+    Reason: Reads paper.summary once per item instead of once per field.
+    """
+    summary = paper.summary
+    return {
+        "arxiv_id": paper.arxiv_id,
+        "title": paper.title,
+        "title_zh": summary.title_zh if summary else None,
+        "abstract": paper.abstract,
+        "abstract_zh": summary.abstract_zh if summary else None,
+        "authors": paper.authors,
+        "categories": paper.categories,
+        "published_at": paper.published_at,
+        "abs_url": paper.abs_url,
+        "pdf_url": paper.pdf_url,
+        "has_summary": summary is not None,
+        "has_deep_analysis": summary is not None and summary.deep_analysis is not None,
+    }
 
 
 # Routes
 
 
+# Reason: Health probes hit this constantly and the payload never changes,
+# so serialize it once at import time
+_HEALTH_BODY = HealthResponse(status="ok", version=__version__).model_dump_json().encode()
+
+
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return HealthResponse(status="ok", version="0.1.0")
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/papers/trigger-analysis")
 async def trigger_analysis_signed(
-    arxiv_id: str = Query(..., description="arXiv paper ID"),
+    arxiv_id: str = Query(..., pattern=_ARXIV_ID_PATTERN, description="arXiv paper ID"),
     platform: str = Query(..., description="Platform identifier (telegram, feishu)"),
     timestamp: int = Query(..., description="Unix timestamp"),
-    nonce: str = Query(..., description="Unique nonce (UUID)"),
+    nonce: str = Query(..., description="Unique one-time nonce"),
     signature: str = Query(..., description="HMAC signature"),
     notifier_id: str | None = Query(None, description="Unique notifier instance ID"),
     background_tasks: BackgroundTasks = None,
@@ -526,6 +630,8 @@ async def trigger_analysis_signed(
             detail="Signed URL feature not configured on server",
         )
 
+    # Reason: verify_url consumes the nonce atomically, so a replayed URL is
+    # rejected here rather than by a separate check-then-mark
     verification = await url_generator.verify_url(
         arxiv_id=arxiv_id,
         platform=platform,
@@ -547,19 +653,7 @@ async def trigger_analysis_signed(
             detail=f"Invalid signed URL: {verification.error}",
         )
 
-    # 2. Mark nonce as used (prevent replay)
-    nonce_storage = url_generator._nonce_storage
-    if nonce_storage:
-        success = await nonce_storage.mark_nonce_used(nonce, arxiv_id, platform)
-        if not success:
-            # Nonce already used
-            return {
-                "arxiv_id": arxiv_id,
-                "status": "already_triggered",
-                "message": "分析已触发，请勿重复点击",
-            }
-
-    # 3. Check if paper exists
+    # 2. Check if paper exists
     storage = get_storage()
     paper = await storage.get_paper_by_arxiv_id(arxiv_id)
     if not paper:
@@ -568,15 +662,16 @@ async def trigger_analysis_signed(
             detail=f"Paper with arXiv ID {arxiv_id} not found",
         )
 
-    # 4. Check if already processing
-    if arxiv_id in _analysis_tasks and _analysis_tasks[arxiv_id] == "processing":
+    # 3. Atomically mark as processing; bail out if another request already did
+    # Reason: Check-then-set would let concurrent clicks enqueue duplicate analyses
+    if not await storage.try_start_analysis(arxiv_id):
         return {
             "arxiv_id": arxiv_id,
             "status": "processing",
             "message": "分析正在进行中，完成后将推送通知",
         }
 
-    # 5. Start background analysis with platform context
+    # 4. Start background analysis with platform context
     # Reason: Pass nonce so it can be reset if analysis fails, enabling retry
     background_tasks.add_task(
         _run_analysis_background_with_platform,
@@ -593,7 +688,7 @@ async def trigger_analysis_signed(
         platform=platform,
     )
 
-    # 6. Return immediately
+    # 5. Return immediately
     return {
         "arxiv_id": arxiv_id,
         "status": "processing",
@@ -604,7 +699,7 @@ async def trigger_analysis_signed(
 
 @router.post("/papers/{arxiv_id}/analyze", response_model=AnalyzeResponse)
 async def analyze_paper(
-    arxiv_id: str,
+    arxiv_id: ArxivIdPath,
     background_tasks: BackgroundTasks,
     user: AuthUser = Depends(check_analyze_rate_limit),
     sync: bool = False,
@@ -626,6 +721,7 @@ async def analyze_paper(
         # Synchronous mode: wait for completion
         try:
             result = await pdf_service.analyze_paper(arxiv_id, force=force)
+            invalidate_paper_cache(arxiv_id)
             return AnalyzeResponse(
                 arxiv_id=arxiv_id,
                 status=result["status"],
@@ -645,12 +741,15 @@ async def analyze_paper(
                 detail=f"Paper with arXiv ID {arxiv_id} not found",
             )
 
-        # Check if already processing (skip check if force=True to allow re-queueing)
-        if not force and arxiv_id in _analysis_tasks and _analysis_tasks[arxiv_id] == "processing":
-            return AnalyzeResponse(
-                arxiv_id=arxiv_id,
-                status="processing",
-            )
+        # Atomically mark as processing (force=True re-queues even if in flight)
+        # Reason: Check-then-set would let concurrent requests enqueue duplicates
+        if not await storage.try_start_analysis(arxiv_id):
+            if not force:
+                return AnalyzeResponse(
+                    arxiv_id=arxiv_id,
+                    status="processing",
+                )
+            await storage.set_analysis_status(arxiv_id, "processing")
 
         # Start background task
         background_tasks.add_task(_run_analysis_background, arxiv_id, force)
@@ -662,7 +761,9 @@ async def analyze_paper(
 
 
 @router.get("/papers/{arxiv_id}/analysis", response_model=AnalyzeResponse)
-async def get_analysis(arxiv_id: str, user: AuthUser = Depends(require_auth)) -> AnalyzeResponse:
+async def get_analysis(
+    arxiv_id: ArxivIdPath, user: AuthUser = Depends(require_auth)
+) -> AnalyzeResponse:
     """Get PDF analysis result for a paper.
 
     Args:
@@ -681,8 +782,8 @@ async def get_analysis(arxiv_id: str, user: AuthUser = Depends(require_auth)) ->
         )
 
     # Check background task status
-    if arxiv_id in _analysis_tasks:
-        task_status = _analysis_tasks[arxiv_id]
+    task_status = await get_storage().get_analysis_status(arxiv_id)
+    if task_status is not None:
         if task_status == "processing":
             return AnalyzeResponse(arxiv_id=arxiv_id, status="processing")
         elif task_status.startswith("error:"):
@@ -708,7 +809,7 @@ async def get_papers_by_date(
     limit: int = Query(20, ge=1, le=200, description="Page size"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
-) -> PaperListResponse:
+) -> Response:
     """Query papers by date.
 
     Three query modes:
@@ -727,52 +828,39 @@ async def get_papers_by_date(
     # 2. Get storage instance
     storage = get_storage()
 
-    # 3. Count total papers
-    total = await storage.count_papers_by_date(start_dt, end_dt)
-
-    # 4. Query papers in date range
-    papers = await storage.get_papers_by_date(start_dt, end_dt)
-
-    # 5. Sort by published_at
-    papers = sorted(
-        papers,
-        key=lambda p: p.published_at,
-        reverse=(sort_order == "desc"),
+    # 3. Count total papers and query one page, sorted by published_at
+    # Reason: The two queries are independent, so run them concurrently to save
+    # a round trip (noticeable with D1). Sorting and pagination happen in storage.
+    total, paginated_papers = await asyncio.gather(
+        storage.count_papers_by_date(start_dt, end_dt),
+        storage.get_papers_by_date(
+            start_dt, end_dt, sort_order=sort_order, limit=limit, offset=offset
+        ),
     )
 
-    # 6. Apply pagination
-    paginated_papers = papers[offset : offset + limit]
-
-    # 7. Build response
-    return PaperListResponse(
-        total=total,
-        count=len(paginated_papers),
-        limit=limit,
-        offset=offset,
-        papers=[
-            PaperListItemResponse(
-                arxiv_id=p.arxiv_id,
-                title=p.title,
-                title_zh=p.summary.title_zh if p.summary else None,
-                abstract=p.abstract,
-                abstract_zh=p.summary.abstract_zh if p.summary else None,
-                authors=p.authors,
-                categories=p.categories,
-                published_at=p.published_at,
-                abs_url=p.abs_url,
-                pdf_url=p.pdf_url,
-                has_summary=p.summary is not None,
-                has_deep_analysis=(p.summary is not None and p.summary.deep_analysis is not None),
-            )
-            for p in paginated_papers
-        ],
-        query_date=date,
-        query_range=({"start": start_date, "end": end_date} if start_date and end_date else None),
-    )
+    # 4. Build response
+    # Reason: Every field comes from an already-validated Paper, so skip pydantic
+    # models entirely and serialize plain dicts with pydantic-core's Rust JSON
+    # encoder (handles datetime natively). response_model documents the shape.
+    items = [_to_list_item(p) for p in paginated_papers]
+    payload = {
+        "total": total,
+        "count": len(items),
+        "limit": limit,
+        "offset": offset,
+        "papers": items,
+        "query_date": date,
+        "query_range": (
+            {"start": start_date, "end": end_date} if start_date and end_date else None
+        ),
+    }
+    return Response(content=to_json(payload), media_type="application/json")
 
 
 @router.get("/papers/{arxiv_id}", response_model=PaperResponse)
-async def get_paper(arxiv_id: str, user: AuthUser = Depends(require_auth)) -> PaperResponse:
+async def get_paper(
+    arxiv_id: ArxivIdPath, user: AuthUser = Depends(require_auth)
+) -> Response:
     """Get paper information by arXiv ID.
 
     Args:
@@ -790,36 +878,36 @@ async def get_paper(arxiv_id: str, user: AuthUser = Depends(require_auth)) -> Pa
             detail=f"Paper with arXiv ID {arxiv_id} not found",
         )
 
-    return PaperResponse(
+    # Reason: Paper is already validated; skip re-validation as in the list endpoint
+    summary = paper.summary
+    payload = PaperResponse.model_construct(
         arxiv_id=paper.arxiv_id,
         title=paper.title,
-        title_zh=paper.summary.title_zh if paper.summary else None,
+        title_zh=summary.title_zh if summary else None,
         abstract=paper.abstract,
-        abstract_zh=paper.summary.abstract_zh if paper.summary else None,
+        abstract_zh=summary.abstract_zh if summary else None,
         authors=paper.authors,
         categories=paper.categories,
         abs_url=paper.abs_url,
         pdf_url=paper.pdf_url,
-        has_summary=paper.summary is not None,
-        has_deep_analysis=(paper.summary is not None and paper.summary.deep_analysis is not None),
+        has_summary=summary is not None,
+        has_deep_analysis=summary is not None and summary.deep_analysis is not None,
     )
+    return Response(content=payload.model_dump_json(), media_type="application/json")
 
 
-def _count_notifier_channels(notifier: Notifier) -> int:
+def _count_notifier_channels() -> int:
     """Count number of active notification channels.
 
     Reason: Provides visibility into how many channels received the notification.
+    The count is fixed once notifiers are built in init_services.
     """
-    from citeo.notifiers.multi import MultiNotifier
-
-    if isinstance(notifier, MultiNotifier):
-        return len(notifier._notifiers)
-    return 1
+    return _notifier_channel_count
 
 
 @router.post("/papers/{arxiv_id}/resend", response_model=ResendResponse)
 async def resend_paper(
-    arxiv_id: str,
+    arxiv_id: ArxivIdPath,
     force: bool = Query(False, description="Ignore relevance score threshold"),
     user: AuthUser = Depends(require_auth),
 ) -> ResendResponse:
@@ -857,7 +945,7 @@ async def resend_paper(
         )
 
     # 2. Validate paper has AI summary
-    if not paper.summary:
+    if not (summary := paper.summary):
         log.warning("Paper has no AI summary")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -876,19 +964,17 @@ async def resend_paper(
         )
 
     if not force:
-        # Get settings to check min_notification_score
-        from citeo.config.settings import settings
-
-        min_score = settings.min_notification_score
-        if paper.summary.relevance_score < min_score:
+        # Reason: Threshold is captured once in init_services
+        min_score = _min_notification_score
+        if summary.relevance_score < min_score:
             log.warning(
                 "Paper score below threshold",
-                score=paper.summary.relevance_score,
+                score=summary.relevance_score,
                 threshold=min_score,
             )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Paper relevance score {paper.summary.relevance_score:.1f} "
+                detail=f"Paper relevance score {summary.relevance_score:.1f} "
                 f"is below threshold {min_score:.1f}. "
                 f"Use force=true to override.",
             )
@@ -904,7 +990,7 @@ async def resend_paper(
         )
 
     # 5. Count notification channels
-    notified_channels = _count_notifier_channels(notifier)
+    notified_channels = _count_notifier_channels()
 
     log.info("Paper notification resent successfully", channels=notified_channels)
 
@@ -919,9 +1005,9 @@ async def resend_paper(
 
 @router.post("/daily-task/trigger", response_model=TriggerDailyTaskResponse)
 async def trigger_daily_task(
-    request: Request,
     force: bool = Query(False, description="Force re-notification of already sent papers"),
     user: AuthUser = Depends(require_auth),
+    paper_service: PaperService = Depends(get_paper_service),
 ) -> TriggerDailyTaskResponse:
     """Manually trigger today's daily task.
 
@@ -933,9 +1019,9 @@ async def trigger_daily_task(
       - force=true: Resets flags and re-sends notifications
 
     Args:
-        request: FastAPI request object (to access app.state)
         force: If True, re-notify papers already sent today
         user: Authenticated user
+        paper_service: Paper service from app.state (injected)
 
     Returns:
         TriggerDailyTaskResponse with execution statistics
@@ -950,17 +1036,9 @@ async def trigger_daily_task(
     log = logger.bind(endpoint="trigger_daily_task", force=force, user=user.user_id)
     log.info("Daily task trigger requested")
 
-    # Get paper service from app.state
-    # Reason: paper_service is stored in app.state during lifespan startup
-    paper_service = getattr(request.app.state, "paper_service", None)
-    if not paper_service:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Paper service not available. Ensure API started with scheduler.",
-        )
-
     try:
         stats = await paper_service.trigger_daily_task(force=force)
+        invalidate_paper_cache()
 
         # Build human-readable message
         # Reason: Provide clear feedback to user about what happened
@@ -999,24 +1077,27 @@ async def trigger_daily_task(
         )
 
 
-# Web view rate limiter
-# Reason: Protect public view endpoint from DoS attacks
-_view_rate_limiter = InMemoryRateLimiter(
+# Web view rate limiter, shared by /view and /export
+# Reason: Protect public view endpoint from DoS attacks. Enforced by
+# RateLimitMiddleware before routing (see create_app).
+view_rate_limiter = InMemoryRateLimiter(
     RateLimitConfig(
-        requests=100,  # 100 views per window
+        requests=settings.web_view_rate_limit,  # views per window
         window_seconds=60,  # 1 minute window
     )
 )
 
 
+@lru_cache(maxsize=8192)
 def _validate_arxiv_id(arxiv_id: str) -> bool:
     """Validate arXiv ID format to prevent injection attacks.
 
     Reason: Input validation for public endpoint without authentication.
+    Kept as an explicit check (rather than a path pattern) so the HTML
+    endpoints keep answering 400 instead of FastAPI's 422. Shared links hit
+    the same IDs repeatedly; the cache is bounded so junk input can't grow it.
     """
-    # arXiv ID format: YYMM.NNNNN or YYMM.NNNNNN or archive/YYMMNNN
-    pattern = r"^(\d{4}\.\d{4,5}|[a-z\-]+/\d{7})$"
-    return bool(re.match(pattern, arxiv_id, re.IGNORECASE))
+    return _ARXIV_ID_RE.match(arxiv_id) is not None
 
 
 def _generate_filename(arxiv_id: str) -> str:
@@ -1028,7 +1109,98 @@ def _generate_filename(arxiv_id: str) -> str:
     return f"{safe_id}-analysis.md"
 
 
-def _generate_markdown_content(paper) -> str:  # type: ignore[no-untyped-def]
+# Fully rendered view pages: arxiv_id -> (etag, html bytes)
+# Reason: The ETag covers every field the template shows, so a regenerated
+# analysis or summary changes the tag and the stale page is simply re-rendered.
+_VIEW_CACHE_MAX = 1024
+_view_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+_VIEW_CACHE_CONTROL = "public, max-age=300"
+
+
+# Short-lived paper cache shared by the public view/export endpoints
+# Reason: Readers typically open /view then /export for the same paper within
+# seconds; both would otherwise hit storage. Concurrent misses for one ID share
+# a single in-flight lookup.
+_PAPER_CACHE_TTL_SECONDS = 60.0
+_PAPER_CACHE_MAX = 2048
+_paper_cache: OrderedDict[str, tuple[float, Paper]] = OrderedDict()
+_paper_fetches: dict[str, asyncio.Future[Paper | None]] = {}
+_paper_cache_generation = 0
+
+
+def invalidate_paper_cache(arxiv_id: str | None = None) -> None:
+    """Drop cached papers after their summary or analysis changed.
+
+    Args:
+        arxiv_id: Paper to drop, or None to clear the whole cache.
+    """
+    global _paper_cache_generation
+    # Reason: A lookup in flight may have read the pre-update row. Detach it so new
+    # requests start a fresh fetch, and bump the generation so its result isn't cached.
+    _paper_cache_generation += 1
+    if arxiv_id is None:
+        _paper_cache.clear()
+        _paper_fetches.clear()
+    else:
+        _paper_cache.pop(arxiv_id, None)
+        _paper_fetches.pop(arxiv_id, None)
+
+
+async def _get_paper_cached(arxiv_id: str) -> Paper | None:
+    """Get a paper by arXiv ID through the short-lived view cache.
+
+    Missing papers are not cached, so a paper stored moments later is found
+    on the next request.
+    """
+    now = time.monotonic()
+    cached = _paper_cache.get(arxiv_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    generation = _paper_cache_generation
+    pending = _paper_fetches.get(arxiv_id)
+    if pending is None:
+        pending = asyncio.ensure_future(get_storage().get_paper_by_arxiv_id(arxiv_id))
+        _paper_fetches[arxiv_id] = pending
+        pending.add_done_callback(lambda done: _forget_paper_fetch(arxiv_id, done))
+
+    # Reason: Shield so one disconnecting client doesn't cancel the shared lookup
+    paper = await asyncio.shield(pending)
+    if paper is not None and generation == _paper_cache_generation:
+        _paper_cache[arxiv_id] = (now + _PAPER_CACHE_TTL_SECONDS, paper)
+        _paper_cache.move_to_end(arxiv_id)
+        if len(_paper_cache) > _PAPER_CACHE_MAX:
+            _paper_cache.popitem(last=False)
+    return paper
+
+
+def _forget_paper_fetch(arxiv_id: str, done: asyncio.Future[Paper | None]) -> None:
+    """Remove a finished lookup unless invalidation already replaced it."""
+    if _paper_fetches.get(arxiv_id) is done:
+        del _paper_fetches[arxiv_id]
+
+
+def _analysis_view_etag(paper: Paper) -> str:
+    """Compute a strong ETag for the analysis view page of a paper."""
+    summary = paper.summary
+    digest = hashlib.sha256(
+        to_json(
+            [
+                paper.arxiv_id,
+                paper.title,
+                summary.title_zh if summary else None,
+                paper.authors,
+                paper.categories,
+                paper.published_at,
+                paper.abs_url,
+                summary.deep_analysis if summary else None,
+            ]
+        )
+    ).hexdigest()[:16]
+    return f'"{digest}"'
+
+
+def _generate_markdown_content(paper) -> bytes:  # type: ignore[no-untyped-def]
     """Generate markdown content for export.
 
     Creates a well-structured markdown document with Chinese deep analysis
@@ -1038,49 +1210,84 @@ def _generate_markdown_content(paper) -> str:  # type: ignore[no-untyped-def]
         paper: Paper object with summary.deep_analysis populated
 
     Returns:
-        Complete markdown document as string
+        Complete markdown document, UTF-8 encoded
     """
     # Get summary for convenience
     # Reason: Avoid repetitive None checks in f-string formatting
     summary = paper.summary
 
+    # Reason: Paper isn't hashable, so pass the exported fields as scalars
+    return _build_markdown_document(
+        title_zh=summary.title_zh,
+        title=paper.title,
+        authors=tuple(paper.authors),
+        categories=tuple(paper.categories),
+        published_at=paper.published_at,
+        abs_url=paper.abs_url,
+        pdf_url=paper.pdf_url,
+        abstract=paper.abstract,
+        abstract_zh=summary.abstract_zh,
+        deep_analysis=summary.deep_analysis,
+    )
+
+
+@lru_cache(maxsize=2048)
+def _build_markdown_document(
+    *,
+    title_zh: str,
+    title: str,
+    authors: tuple[str, ...],
+    categories: tuple[str, ...],
+    published_at: datetime,
+    abs_url: str,
+    pdf_url: str,
+    abstract: str,
+    abstract_zh: str,
+    deep_analysis: str,
+) -> bytes:
+    """Build the export document, memoized on its content.
+
+    Reason: Repeat exports of an unchanged analysis return the cached bytes
+    (already UTF-8 encoded for the response body); any edited field produces
+    a new key, so no explicit invalidation is needed.
+    """
     # Format metadata
-    authors_str = ", ".join(paper.authors) if paper.authors else "Unknown"
-    categories_str = ", ".join(paper.categories) if paper.categories else "Uncategorized"
-    published_date = paper.published_at.strftime("%Y-%m-%d")
+    authors_str = ", ".join(authors) if authors else "Unknown"
+    categories_str = ", ".join(categories) if categories else "Uncategorized"
+    published_date = published_at.strftime("%Y-%m-%d")
 
     # Build markdown document
     # Reason: Use Chinese title as H1 (primary for Chinese blog),
     # English metadata preserves citation accuracy
-    markdown_content = f"""# {summary.title_zh}
+    markdown_content = f"""# {title_zh}
 
-## {paper.title}
+## {title}
 
 **Authors:** {authors_str}
 **Categories:** {categories_str}
 **Published:** {published_date}
-**arXiv:** [Abstract]({paper.abs_url}) | [PDF]({paper.pdf_url})
+**arXiv:** [Abstract]({abs_url}) | [PDF]({pdf_url})
 
 ## Abstract
 
-{paper.abstract}
+{abstract}
 
 **中文摘要：**
 
-{summary.abstract_zh}
+{abstract_zh}
 
 ---
 
 ## Deep Analysis
 
-{summary.deep_analysis}
+{deep_analysis}
 
 ---
 
 *Generated by Citeo - arXiv RSS subscription with AI summarization*
 """
 
-    return markdown_content
+    return markdown_content.encode()
 
 
 @router.get(
@@ -1095,12 +1302,13 @@ def _generate_markdown_content(paper) -> str:  # type: ignore[no-untyped-def]
             "description": "HTML page with formatted analysis",
             "content": {"text/html": {"example": "<!DOCTYPE html>..."}},
         },
+        304: {"description": "Analysis unchanged since the client's cached copy (ETag)"},
         400: {"description": "Invalid arXiv ID format"},
         404: {"description": "Paper not found or analysis not available"},
-        429: {"description": "Rate limit exceeded (100 requests/minute per IP)"},
+        429: {"description": "Rate limit exceeded (WEB_VIEW_RATE_LIMIT requests/minute per IP)"},
     },
 )
-async def view_analysis(arxiv_id: str, request: Request) -> HTMLResponse:
+async def view_analysis(arxiv_id: str, request: Request) -> Response:
     """View deep analysis in web page (public access, no authentication required).
 
     Provides a beautifully formatted web view of the deep analysis report.
@@ -1110,28 +1318,18 @@ async def view_analysis(arxiv_id: str, request: Request) -> HTMLResponse:
         arxiv_id: arXiv paper ID (e.g., "2512.14709")
         request: FastAPI request object (required by Jinja2Templates)
 
+    Rate limiting is applied per client IP by RateLimitMiddleware.
+
     Returns:
-        HTMLResponse with rendered analysis page
+        HTMLResponse with rendered analysis page, or an empty 304 response
+        when the client's If-None-Match matches the current ETag
 
     Raises:
         HTTPException 429: Rate limit exceeded
         HTTPException 400: Invalid arXiv ID format
         HTTPException 404: Paper not found or analysis not available
     """
-    # 1. Rate limit by IP address
-    # Reason: Prevent DoS attacks on public endpoint
-    client_ip = request.client.host if request.client else "unknown"
-
-    try:
-        _view_rate_limiter.check_rate_limit(client_ip)
-    except RateLimitExceededError as e:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=f"Too many requests. Please try again in {e.retry_after} seconds.",
-            headers={"Retry-After": str(e.retry_after)},
-        )
-
-    # 2. Validate arXiv ID format
+    # 1. Validate arXiv ID format
     # Reason: Prevent path traversal and injection attacks
     if not _validate_arxiv_id(arxiv_id):
         raise HTTPException(
@@ -1139,9 +1337,8 @@ async def view_analysis(arxiv_id: str, request: Request) -> HTMLResponse:
             detail=f"Invalid arXiv ID format: {arxiv_id}",
         )
 
-    # 3. Fetch paper from storage
-    storage = get_storage()
-    paper = await storage.get_paper_by_arxiv_id(arxiv_id)
+    # 2. Fetch paper (shared short-lived cache across view/export)
+    paper = await _get_paper_cached(arxiv_id)
 
     if not paper:
         raise HTTPException(
@@ -1149,7 +1346,7 @@ async def view_analysis(arxiv_id: str, request: Request) -> HTMLResponse:
             detail=f"Paper with arXiv ID {arxiv_id} not found",
         )
 
-    # 4. Check if deep analysis exists
+    # 3. Check if deep analysis exists
     if not paper.summary or not paper.summary.deep_analysis:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1157,27 +1354,41 @@ async def view_analysis(arxiv_id: str, request: Request) -> HTMLResponse:
             "Please trigger analysis first.",
         )
 
-    # 5. Convert Markdown to HTML
-    # Reason: Deep analysis is stored in Markdown format, need HTML for web view
-    analysis_html = markdown.markdown(
-        paper.summary.deep_analysis,
-        extensions=[
-            "fenced_code",  # ```code blocks```
-            "tables",  # | table | support |
-            "nl2br",  # Convert \n to <br>
-        ],
+    # 4. Short-circuit with 304 or a cached page when content is unchanged
+    etag = _analysis_view_etag(paper)
+    cache_headers = {"ETag": etag, "Cache-Control": _VIEW_CACHE_CONTROL}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    cached = _view_cache.get(arxiv_id)
+    if cached is not None and cached[0] == etag:
+        _view_cache.move_to_end(arxiv_id)
+        return HTMLResponse(content=cached[1], headers=cache_headers)
+
+    # 5. Use the HTML rendered when the analysis was stored
+    # Reason: Rows analyzed before HTML was persisted fall back to converting
+    # the stored Markdown here (memoized by content hash)
+    analysis_html = paper.summary.deep_analysis_html or render_markdown_html(
+        paper.summary.deep_analysis
     )
 
     # 6. Render template
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "analysis_view.html",
         {
             "request": request,
             "paper": paper,
             "analysis_html": analysis_html,
         },
+        headers=cache_headers,
     )
 
+    _view_cache[arxiv_id] = (etag, bytes(response.body))
+    if len(_view_cache) > _VIEW_CACHE_MAX:
+        _view_cache.popitem(last=False)
+    return response
+
 
 @router.get(
     "/export/{arxiv_id}",
@@ -1192,7 +1403,7 @@ async def view_analysis(arxiv_id: str, request: Request) -> HTMLResponse:
         429: {"description": "Rate limit exceeded"},
     },
 )
-async def export_analysis(arxiv_id: str, request: Request) -> PlainTextResponse:
+async def export_analysis(arxiv_id: str, request: Request) -> Response:
     """Export deep analysis as downloadable Markdown file.
 
     Provides the deep analysis as a well-formatted markdown document
@@ -1201,30 +1412,18 @@ async def export_analysis(arxiv_id: str, request: Request) -> PlainTextResponse:
 
     Args:
         arxiv_id: arXiv paper ID (e.g., "2512.14709")
-        request: FastAPI request object (for rate limiting)
+        request: FastAPI request object (rate limited per client IP by
+            RateLimitMiddleware, sharing the view budget)
 
     Returns:
-        PlainTextResponse with markdown content and download headers
+        Response with UTF-8 markdown content and download headers
 
     Raises:
         HTTPException 429: Rate limit exceeded
         HTTPException 400: Invalid arXiv ID format
         HTTPException 404: Paper not found or analysis not available
     """
-    # 1. Rate limit by IP address
-    # Reason: Reuse view rate limiter (export typically follows viewing)
-    client_ip = request.client.host if request.client else "unknown"
-
-    try:
-        _view_rate_limiter.check_rate_limit(client_ip)
-    except RateLimitExceededError as e:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=f"Too many requests. Please try again in {e.retry_after} seconds.",
-            headers={"Retry-After": str(e.retry_after)},
-        )
-
-    # 2. Validate arXiv ID format
+    # 1. Validate arXiv ID format
     # Reason: Prevent path traversal and injection attacks
     if not _validate_arxiv_id(arxiv_id):
         raise HTTPException(
@@ -1232,9 +1431,8 @@ async def export_analysis(arxiv_id: str, request: Request) -> PlainTextResponse:
             detail=f"Invalid arXiv ID format: {arxiv_id}",
         )
 
-    # 3. Fetch paper from storage
-    storage = get_storage()
-    paper = await storage.get_paper_by_arxiv_id(arxiv_id)
+    # 2. Fetch paper (shared short-lived cache across view/export)
+    paper = await _get_paper_cached(arxiv_id)
 
     if not paper:
         raise HTTPException(
@@ -1242,25 +1440,27 @@ async def export_analysis(arxiv_id: str, request: Request) -> PlainTextResponse:
             detail=f"Paper with arXiv ID {arxiv_id} not found",
         )
 
-    # 4. Check if deep analysis exists
+    # 3. Check if deep analysis exists
     if not paper.summary or not paper.summary.deep_analysis:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Deep analysis not available for paper {arxiv_id}",
         )
 
-    # 5. Generate markdown content
+    # 4. Generate markdown content
     markdown_content = _generate_markdown_content(paper)
 
-    # 6. Generate filename
+    # 5. Generate filename
     filename = _generate_filename(arxiv_id)
 
-    # 7. Return as downloadable file
+    # 6. Return as downloadable file
     # Reason: Content-Disposition triggers browser download,
     # UTF-8 encoding ensures Chinese characters display correctly
-    headers = {
-        "Content-Disposition": f'attachment; filename="{filename}"',
-        "Content-Type": "text/markdown; charset=utf-8",
-    }
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
 
-    return PlainTextResponse(content=markdown_content, headers=headers)
+    # Reason: Body is pre-encoded bytes, so Response only sets Content-Length
+    return Response(
+        content=markdown_content,
+        media_type="text/markdown; charset=utf-8",
+        headers=headers,
+    )
@@ -1,6 +1,7 @@
 """API Key authenticator implementation."""
 
-import secrets
+import hashlib
+import hmac
 
 import structlog
 
@@ -9,11 +10,17 @@ from citeo.auth.models import AuthUser
 logger = structlog.get_logger()
 
 
+def _hash_api_key(api_key: str) -> bytes:
+    """Hash an API key to a fixed-size digest for comparison."""
+    return hashlib.blake2b(api_key.encode(), digest_size=32).digest()
+
+
 class APIKeyAuthenticator:
     """API Key authentication implementation.
 
     Reason: Simple single-key validation for single-user mode.
-    Uses secrets.compare_digest for timing-attack resistant comparison.
+    Compares fixed-size BLAKE2b digests with hmac.compare_digest, which stays
+    timing-safe and lets multi-key support become a set lookup of digests.
     """
 
     def __init__(self, api_key: str):
@@ -23,6 +30,7 @@ class APIKeyAuthenticator:
             api_key: The valid API key to check against.
         """
         self._api_key = api_key
+        self._key_hash = _hash_api_key(api_key)
 
     async def authenticate(
         self,
@@ -42,7 +50,7 @@ class APIKeyAuthenticator:
             return None
 
         # Reason: Use constant-time comparison to prevent timing attacks
-        if secrets.compare_digest(api_key, self._api_key):
+        if hmac.compare_digest(_hash_api_key(api_key), self._key_hash):
             logger.debug("API key authentication successful")
             return AuthUser(auth_method="api_key")
 
@@ -58,8 +58,15 @@ class CombinedAuthenticator:
         Raises:
             TokenExpiredError: If JWT token is expired (allows specific handling).
         """
+        # Reason: Single-user deployments mostly send only X-API-Key; skip the
+        # JWT branch entirely when no bearer token was supplied
+        if not bearer_token:
+            if api_key and self._api_key_auth:
+                return await self._api_key_auth.authenticate(api_key=api_key)
+            return None
+
         # Try JWT first (preferred for programmatic access)
-        if bearer_token and self._jwt_auth:
+        if self._jwt_auth:
             try:
                 result = await self._jwt_auth.authenticate(bearer_token=bearer_token)
                 if result:
@@ -4,8 +4,12 @@ Reason: Using PyJWT for JWT operations, which is a lightweight
 and well-maintained library.
 """
 
+import hashlib
 import secrets
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 import jwt
 import structlog
@@ -13,10 +17,29 @@ import structlog
 from citeo.auth.exceptions import TokenExpiredError
 from citeo.auth.models import AuthUser, TokenPayload
 
+# Reason: jwt.types.Options only exists in newer PyJWT releases than the minimum supported
+if TYPE_CHECKING:
+    from jwt.types import Options
+
 logger = structlog.get_logger()
 
 # JWT algorithm - HS256 is appropriate for single-user scenarios
 ALGORITHM = "HS256"
+_ALGORITHMS = [ALGORITHM]
+
+# Reason: Tokens issued here always carry sub/exp/iat and never iss/aud, so
+# require the former and skip the unused claim checks
+_DECODE_OPTIONS: "Options" = {
+    "require": ["exp", "iat", "sub"],
+    "verify_aud": False,
+    "verify_iss": False,
+}
+
+# Decoded token cache: (secret, token digest) -> (exp timestamp, payload)
+# Reason: API clients reuse one access token for its whole lifetime, so repeat
+# requests can skip the HMAC verify and JSON parse. Only valid tokens are cached.
+_TOKEN_CACHE_MAX = 1024
+_token_cache: OrderedDict[tuple[str, bytes], tuple[float, TokenPayload]] = OrderedDict()
 
 
 def generate_token_id() -> str:
@@ -51,7 +74,7 @@ def create_access_token(
     if expires_delta is None:
         expires_delta = timedelta(hours=1)
 
-    now = datetime.utcnow()
+    now = datetime.now(UTC)
     expire = now + expires_delta
 
     payload = {
@@ -86,7 +109,7 @@ def create_refresh_token(
     if expires_delta is None:
         expires_delta = timedelta(days=7)
 
-    now = datetime.utcnow()
+    now = datetime.now(UTC)
     expire = now + expires_delta
     token_id = generate_token_id()
 
@@ -120,22 +143,36 @@ def decode_token(token: str, secret_key: str) -> TokenPayload | None:
     Raises:
         TokenExpiredError: If token has expired.
     """
-    try:
-        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
+    cache_key = (secret_key, hashlib.blake2b(token.encode(), digest_size=16).digest())
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        exp_ts, cached_payload = cached
+        if exp_ts > time.time():
+            _token_cache.move_to_end(cache_key)
+            return cached_payload
+        del _token_cache[cache_key]
+        logger.warning("JWT token expired")
+        raise TokenExpiredError()
 
-        # Extract jti if present
-        jti = payload.get("jti")
+    try:
+        payload = jwt.decode(token, secret_key, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
 
         token_payload = TokenPayload(
             sub=payload.get("sub", "default"),
-            exp=datetime.fromtimestamp(payload["exp"]),
-            iat=datetime.fromtimestamp(payload.get("iat", datetime.utcnow().timestamp())),
+            exp=datetime.fromtimestamp(payload["exp"], tz=UTC),
+            iat=(
+                datetime.fromtimestamp(payload["iat"], tz=UTC)
+                if "iat" in payload
+                else datetime.now(UTC)
+            ),
             type=payload.get("type", "access"),
+            # Reason: Only refresh tokens carry jti; treat empty as absent
+            jti=payload.get("jti") or None,
         )
 
-        # Add jti to payload if present
-        if jti:
-            token_payload.jti = jti
+        _token_cache[cache_key] = (float(payload["exp"]), token_payload)
+        if len(_token_cache) > _TOKEN_CACHE_MAX:
+            _token_cache.popitem(last=False)
 
         return token_payload
     except jwt.ExpiredSignatureError:
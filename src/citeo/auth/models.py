@@ -1,30 +1,52 @@
-"""Authentication-related Pydantic models."""
+"""Authentication-related models.
 
-from datetime import datetime
+Reason: AuthUser and TokenPayload are internal values built on every
+authenticated request and never serialized in API responses, so they are
+slotted frozen dataclasses rather than Pydantic models. Request/response
+bodies stay Pydantic.
+"""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 
 from pydantic import BaseModel, Field
 
 
-class AuthUser(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthUser:
     """Authenticated user information.
 
     Reason: Single-user mode simplifies this to just auth method tracking.
     Can be extended for multi-user scenarios.
+
+    Attributes:
+        user_id: User identifier.
+        auth_method: How user was authenticated: 'api_key', 'jwt' or 'disabled'.
+        authenticated_at: When authentication happened.
     """
 
-    user_id: str = Field(default="default", description="User identifier")
-    auth_method: str = Field(..., description="How user was authenticated: 'api_key' or 'jwt'")
-    authenticated_at: datetime = Field(default_factory=datetime.utcnow)
+    user_id: str = "default"
+    auth_method: str
+    authenticated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
-class TokenPayload(BaseModel):
-    """JWT token payload structure."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TokenPayload:
+    """JWT token payload structure.
+
+    Attributes:
+        sub: Subject (user ID).
+        exp: Expiration time.
+        iat: Issued at.
+        type: Token type: 'access' or 'refresh'.
+        jti: JWT ID (for revocation).
+    """
 
-    sub: str = Field(default="default", description="Subject (user ID)")
-    exp: datetime = Field(..., description="Expiration time")
-    iat: datetime = Field(default_factory=datetime.utcnow, description="Issued at")
-    type: str = Field(default="access", description="Token type: 'access' or 'refresh'")
-    jti: str | None = Field(default=None, description="JWT ID (for revocation)")
+    sub: str = "default"
+    exp: datetime
+    iat: datetime = field(default_factory=lambda: datetime.now(UTC))
+    type: str = "access"
+    jti: str | None = None
 
 
 class TokenResponse(BaseModel):
@@ -5,7 +5,6 @@ For production, consider Redis-based implementation.
 """
 
 import time
-from collections import defaultdict
 from dataclasses import dataclass
 
 import structlog
@@ -15,26 +14,31 @@ from citeo.auth.exceptions import RateLimitExceededError
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RateLimitConfig:
     """Rate limit configuration.
 
     Attributes:
         requests: Maximum requests allowed in window.
         window_seconds: Time window in seconds.
+        buckets: Number of counting buckets the window is split into.
     """
 
     requests: int = 10
     window_seconds: int = 60
+    buckets: int = 6
 
 
 class InMemoryRateLimiter:
-    """Simple in-memory sliding window rate limiter.
+    """Simple in-memory bucketed sliding window rate limiter.
 
     Reason: Good enough for single-instance deployment.
     Not suitable for multi-instance (use Redis in that case).
 
-    Note: This implementation uses a simple sliding window log approach.
+    Note: The window is split into a ring of fixed-size buckets, each holding
+    a request count. Per-identifier state is a handful of ints regardless of
+    the limit, and a check sums the ring. A bucket expires as a whole, so the
+    window slides in steps of window_seconds / buckets.
     """
 
     def __init__(self, config: RateLimitConfig | None = None):
@@ -44,8 +48,14 @@ class InMemoryRateLimiter:
             config: Rate limit configuration. Defaults to 10 requests/minute.
         """
         self.config = config or RateLimitConfig()
-        # Dict of identifier -> list of request timestamps
-        self._requests: dict[str, list[float]] = defaultdict(list)
+        self._bucket_seconds = self.config.window_seconds / self.config.buckets
+        # Dict of identifier -> request counts per bucket (ring, indexed mod buckets)
+        self._buckets: dict[str, list[int]] = {}
+        # Dict of identifier -> absolute index of the newest bucket it touched
+        self._last_bucket: dict[str, int] = {}
+        # Dict of identifier -> when its current throttling period ends
+        self._throttled_until: dict[str, float] = {}
+        self._last_sweep = time.monotonic()
 
     def check_rate_limit(self, identifier: str) -> None:
         """Check if request is within rate limit.
@@ -56,30 +66,35 @@ class InMemoryRateLimiter:
         Raises:
             RateLimitExceededError: If rate limit exceeded.
         """
-        now = time.time()
-        window_start = now - self.config.window_seconds
+        # Reason: Monotonic clock so wall-clock adjustments can't reset windows
+        now = time.monotonic()
+        current = int(now // self._bucket_seconds)
+        self._sweep_idle(now, current)
 
-        # Get request timestamps for this identifier
-        request_times = self._requests[identifier]
-
-        # Remove expired timestamps (outside window)
-        request_times[:] = [t for t in request_times if t > window_start]
+        buckets = self._advance(identifier, current)
+        total = sum(buckets)
 
         # Check if over limit
-        if len(request_times) >= self.config.requests:
-            # Calculate retry-after
-            oldest_in_window = min(request_times)
-            retry_after = int(oldest_in_window + self.config.window_seconds - now) + 1
-            logger.warning(
-                "Rate limit exceeded",
-                identifier=identifier,
-                requests=len(request_times),
-                limit=self.config.requests,
-            )
+        if total >= self.config.requests:
+            # Calculate retry-after from when the oldest non-empty bucket expires
+            size = self.config.buckets
+            oldest = next(i for i in range(current - size + 1, current + 1) if buckets[i % size])
+            frees_at = (oldest + size) * self._bucket_seconds
+            retry_after = int(frees_at - now) + 1
+            # Reason: Under a flood every request lands here; log once per
+            # throttling period instead of rendering a warning per rejection
+            if self._throttled_until.get(identifier, 0.0) <= now:
+                self._throttled_until[identifier] = frees_at
+                logger.warning(
+                    "Rate limit exceeded",
+                    identifier=identifier,
+                    requests=total,
+                    limit=self.config.requests,
+                )
             raise RateLimitExceededError(retry_after=retry_after)
 
         # Record this request
-        request_times.append(now)
+        buckets[current % self.config.buckets] += 1
 
     def get_remaining(self, identifier: str) -> int:
         """Get remaining requests in current window.
@@ -90,12 +105,52 @@ class InMemoryRateLimiter:
         Returns:
             Number of remaining requests allowed.
         """
-        now = time.time()
-        window_start = now - self.config.window_seconds
-        request_times = self._requests.get(identifier, [])
-        current_count = sum(1 for t in request_times if t > window_start)
+        buckets = self._buckets.get(identifier)
+        if buckets is None:
+            return self.config.requests
+
+        size = self.config.buckets
+        current = int(time.monotonic() // self._bucket_seconds)
+        last = self._last_bucket[identifier]
+        # Only buckets written at or after (current - size + 1) are still in the window
+        current_count = sum(
+            buckets[i % size] for i in range(max(last - size, current - size) + 1, last + 1)
+        )
         return max(0, self.config.requests - current_count)
 
+    def _advance(self, identifier: str, current: int) -> list[int]:
+        """Rotate an identifier's ring to the current bucket, zeroing expired buckets."""
+        size = self.config.buckets
+        buckets = self._buckets.get(identifier)
+        if buckets is None:
+            buckets = self._buckets[identifier] = [0] * size
+        else:
+            last = self._last_bucket[identifier]
+            if current - last >= size:
+                buckets[:] = [0] * size
+            else:
+                for i in range(last + 1, current + 1):
+                    buckets[i % size] = 0
+        self._last_bucket[identifier] = current
+        return buckets
+
+    def _sweep_idle(self, now: float, current: int) -> None:
+        """Drop identifiers with no requests inside the window.
+
+        Reason: Bounds memory for one-off clients (e.g. many distinct IPs on
+        the public view endpoint). Runs at most once per window, so the full
+        scan is amortized across requests.
+        """
+        if now < self._last_sweep + self.config.window_seconds:
+            return
+        self._last_sweep = now
+        expired = current - self.config.buckets
+        idle = [key for key, last in self._last_bucket.items() if last <= expired]
+        for key in idle:
+            del self._buckets[key]
+            del self._last_bucket[key]
+            self._throttled_until.pop(key, None)
+
     def reset(self, identifier: str | None = None) -> None:
         """Reset rate limit counters.
 
@@ -103,9 +158,13 @@ class InMemoryRateLimiter:
             identifier: Specific identifier to reset. If None, resets all.
         """
         if identifier:
-            self._requests.pop(identifier, None)
+            self._buckets.pop(identifier, None)
+            self._last_bucket.pop(identifier, None)
+            self._throttled_until.pop(identifier, None)
         else:
-            self._requests.clear()
+            self._buckets.clear()
+            self._last_bucket.clear()
+            self._throttled_until.clear()
 
 
 # Global rate limiter for /analyze endpoint
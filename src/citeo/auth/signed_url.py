@@ -4,12 +4,16 @@ Provides secure, one-time-use signed URLs for triggering PDF deep analysis
 from notification platforms (Telegram, Feishu) without exposing API keys.
 """
 
+import asyncio
+import base64
 import hashlib
 import hmac
+import logging
 import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
+from urllib.parse import urlencode
 
 import aiosqlite
 import structlog
@@ -18,8 +22,19 @@ from citeo.config.settings import settings
 
 logger = structlog.get_logger()
 
+# Rows removed per DELETE statement when purging expired nonces
+_CLEANUP_BATCH_SIZE = 1000
 
-@dataclass
+# Platforms that may trigger analysis through signed URLs
+_ALLOWED_PLATFORMS: frozenset[str] = frozenset({"telegram", "feishu"})
+
+# Signature tag length in bytes (HMAC-SHA256 truncated to 128 bits)
+_SIGNATURE_BYTES = 16
+# Length of full hex-digest signatures issued before truncation
+_LEGACY_SIGNATURE_LENGTH = 64
+
+
+@dataclass(frozen=True, slots=True)
 class SignedURLVerification:
     """Result of signed URL verification."""
 
@@ -34,6 +49,8 @@ class NonceStorage:
 
     Reason: Store nonce state in SQLite to track used nonces and prevent
     replay attacks. Supports automatic cleanup of expired nonces.
+    Uses one long-lived WAL-mode connection instead of a connection (and
+    worker thread) per call, since every signed-URL click hits this path.
     """
 
     def __init__(self, db_path: str):
@@ -43,80 +60,79 @@ class NonceStorage:
             db_path: Path to SQLite database.
         """
         self._db_path = db_path
-
-    async def _init_table(self) -> None:
+        self._conn: aiosqlite.Connection | None = None
+        self._conn_lock = asyncio.Lock()
+
+    async def _get_conn(self) -> aiosqlite.Connection:
+        """Get the shared connection, opening it and creating the table on first use."""
+        if self._conn is not None:
+            return self._conn
+
+        async with self._conn_lock:
+            if self._conn is None:
+                conn = await aiosqlite.connect(self._db_path)
+                await conn.execute("PRAGMA journal_mode=WAL")
+                await conn.execute("PRAGMA synchronous=NORMAL")
+                await conn.execute("PRAGMA temp_store=MEMORY")
+                await conn.execute("PRAGMA cache_size=-64000")
+                await self._init_table(conn)
+                self._conn = conn
+        return self._conn
+
+    async def _init_table(self, db: aiosqlite.Connection) -> None:
         """Create nonce table if it doesn't exist."""
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS signed_url_nonces (
-                    nonce TEXT PRIMARY KEY,
-                    created_at INTEGER NOT NULL,
-                    consumed_at INTEGER,
-                    arxiv_id TEXT NOT NULL,
-                    platform TEXT NOT NULL
-                )
-                """
-            )
-            # Index for cleanup queries
-            await db.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_nonces_created_at
-                ON signed_url_nonces(created_at)
-                """
-            )
-            await db.commit()
-
-    async def is_nonce_used(self, nonce: str) -> bool:
-        """Check if a nonce has been used.
-
-        Args:
-            nonce: The nonce to check.
-
-        Returns:
-            True if nonce exists (already used), False otherwise.
-        """
-        await self._init_table()
-
-        async with aiosqlite.connect(self._db_path) as db:
-            async with db.execute(
-                "SELECT consumed_at FROM signed_url_nonces WHERE nonce = ?",
-                (nonce,),
-            ) as cursor:
-                row = await cursor.fetchone()
-                return row is not None
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS signed_url_nonces (
+                nonce TEXT PRIMARY KEY,
+                created_at INTEGER NOT NULL,
+                consumed_at INTEGER,
+                arxiv_id TEXT NOT NULL,
+                platform TEXT NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        # Index for cleanup queries
+        await db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_nonces_created_at
+            ON signed_url_nonces(created_at)
+            """
+        )
+        await db.commit()
 
-    async def mark_nonce_used(self, nonce: str, arxiv_id: str, platform: str) -> bool:
-        """Mark a nonce as used.
+    async def try_consume_nonce(self, nonce: str, arxiv_id: str, platform: str) -> bool:
+        """Atomically mark a nonce as used if it hasn't been used yet.
 
         Args:
-            nonce: The nonce to mark as used.
+            nonce: The nonce to consume.
             arxiv_id: Associated arXiv paper ID.
             platform: Platform that triggered the request.
 
         Returns:
-            True if successfully marked, False if already exists.
-        """
-        await self._init_table()
+            True if the nonce was consumed by this call, False if already used.
 
+        Reason: A single INSERT OR IGNORE replaces the SELECT-then-INSERT pair,
+        halving the queries and closing the window where two concurrent clicks
+        both see the nonce as unused.
+        """
+        db = await self._get_conn()
         now = int(time.time())
 
-        try:
-            async with aiosqlite.connect(self._db_path) as db:
-                await db.execute(
-                    """
-                    INSERT INTO signed_url_nonces
-                    (nonce, created_at, consumed_at, arxiv_id, platform)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (nonce, now, now, arxiv_id, platform),
-                )
-                await db.commit()
-                return True
-        except aiosqlite.IntegrityError:
-            # Nonce already exists
+        cursor = await db.execute(
+            """
+            INSERT OR IGNORE INTO signed_url_nonces
+            (nonce, created_at, consumed_at, arxiv_id, platform)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (nonce, now, now, arxiv_id, platform),
+        )
+        await db.commit()
+
+        if cursor.rowcount == 0:
             logger.warning("Nonce already used", nonce=nonce)
             return False
+        return True
 
     async def reset_nonce(self, nonce: str) -> bool:
         """Reset a used nonce so it can be reused (e.g., after analysis failure).
@@ -130,15 +146,13 @@ class NonceStorage:
         Reason: When deep analysis fails, the user should be able to
         click the button again. Resetting the nonce re-enables the signed URL.
         """
-        await self._init_table()
-
-        async with aiosqlite.connect(self._db_path) as db:
-            cursor = await db.execute(
-                "DELETE FROM signed_url_nonces WHERE nonce = ?",
-                (nonce,),
-            )
-            await db.commit()
-            deleted = cursor.rowcount > 0
+        db = await self._get_conn()
+        cursor = await db.execute(
+            "DELETE FROM signed_url_nonces WHERE nonce = ?",
+            (nonce,),
+        )
+        await db.commit()
+        deleted = cursor.rowcount > 0
 
         if deleted:
             logger.info("Nonce reset for retry", nonce=nonce[:8])
@@ -154,23 +168,37 @@ class NonceStorage:
         Returns:
             Number of nonces deleted.
         """
-        await self._init_table()
-
+        db = await self._get_conn()
         cutoff = int(time.time()) - (expiry_hours * 3600)
 
-        async with aiosqlite.connect(self._db_path) as db:
+        # Reason: Delete in bounded batches, committing each, so the write lock
+        # is released between batches and nonce consumption can interleave
+        deleted = 0
+        while True:
             cursor = await db.execute(
-                "DELETE FROM signed_url_nonces WHERE created_at < ?",
-                (cutoff,),
+                """
+                DELETE FROM signed_url_nonces WHERE nonce IN (
+                    SELECT nonce FROM signed_url_nonces WHERE created_at < ? LIMIT ?
+                )
+                """,
+                (cutoff, _CLEANUP_BATCH_SIZE),
             )
             await db.commit()
-            deleted = cursor.rowcount
+            if cursor.rowcount <= 0:
+                break
+            deleted += cursor.rowcount
 
         if deleted > 0:
             logger.info("Cleaned up expired nonces", count=deleted)
 
         return deleted
 
+    async def close(self) -> None:
+        """Close the shared connection."""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
 
 class SignedURLGenerator:
     """Generate and verify signed URLs for deep analysis triggers.
@@ -179,20 +207,32 @@ class SignedURLGenerator:
     Uses HMAC-SHA256 with nonce for one-time-use URLs.
     """
 
-    def __init__(self, secret: str, expiry_hours: int = 24, nonce_storage: NonceStorage = None):
+    def __init__(
+        self,
+        secret: str,
+        expiry_hours: int = 24,
+        nonce_storage: NonceStorage = None,
+        base_url: str | None = None,
+    ):
         """Initialize with signing secret and expiry time.
 
         Args:
             secret: Signing secret key (min 32 chars recommended).
             expiry_hours: URL expiry time in hours (default: 24).
             nonce_storage: NonceStorage instance for tracking used nonces.
+            base_url: Public API base URL (default: settings.api_base_url).
         """
         if len(secret) < 16:
             raise ValueError("Signing secret must be at least 16 characters")
 
-        self._secret = secret
+        # Reason: The key is fixed, so the keyed HMAC state (inner/outer pads) is
+        # built once and copied per signature instead of re-encoding the secret
+        self._mac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
         self._expiry_seconds = expiry_hours * 3600
         self._nonce_storage = nonce_storage
+        self._trigger_url = (
+            f"{(base_url or settings.api_base_url).rstrip('/')}/api/papers/trigger-analysis"
+        )
 
     def generate_analysis_url(self, arxiv_id: str, platform: str, notifier_id: str | None = None) -> str:
         """Generate signed URL for triggering analysis.
@@ -204,32 +244,39 @@ class SignedURLGenerator:
 
         Returns:
             Full URL with signature and nonce.
+
+        Raises:
+            ValueError: If platform is not one verify_url accepts.
         """
+        if platform not in _ALLOWED_PLATFORMS:
+            raise ValueError(f"Invalid platform: {platform}")
+
         timestamp = int(time.time())
-        nonce = str(uuid.uuid4())  # Generate unique nonce
+        nonce = _b64url(uuid.uuid4().bytes)  # Generate unique nonce (128-bit)
         signature = self._compute_signature(arxiv_id, platform, timestamp, nonce, notifier_id)
 
-        base_url = settings.api_base_url.rstrip("/")
-        url = (
-            f"{base_url}/api/papers/trigger-analysis?"
-            f"arxiv_id={arxiv_id}&"
-            f"platform={platform}&"
-            f"timestamp={timestamp}&"
-            f"nonce={nonce}&"
-            f"signature={signature}"
-        )
-
+        params = {
+            "arxiv_id": arxiv_id,
+            "platform": platform,
+            "timestamp": timestamp,
+            "nonce": nonce,
+            "signature": signature,
+        }
         # Add notifier_id if provided
         if notifier_id:
-            url += f"&notifier_id={notifier_id}"
-
-        logger.debug(
-            "Generated signed URL",
-            arxiv_id=arxiv_id,
-            platform=platform,
-            notifier_id=notifier_id,
-            expires_at=datetime.fromtimestamp(timestamp + self._expiry_seconds).isoformat(),
-        )
+            params["notifier_id"] = notifier_id
+        url = f"{self._trigger_url}?{urlencode(params)}"
+
+        # Reason: Called once per paper per channel when sending notifications;
+        # skip building the expiry timestamp when debug is filtered out
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Generated signed URL",
+                arxiv_id=arxiv_id,
+                platform=platform,
+                notifier_id=notifier_id,
+                expires_at=datetime.fromtimestamp(timestamp + self._expiry_seconds).isoformat(),
+            )
 
         return url
 
@@ -247,7 +294,8 @@ class SignedURLGenerator:
             notifier_id: Optional unique notifier instance ID.
 
         Returns:
-            SignedURLVerification with validation result.
+            SignedURLVerification with validation result. A valid result means
+            the nonce has been consumed.
         """
         # Check timestamp validity
         current_time = int(time.time())
@@ -264,25 +312,33 @@ class SignedURLGenerator:
             )
 
         # Validate platform
-        if platform not in ["telegram", "feishu"]:
+        if platform not in _ALLOWED_PLATFORMS:
             return SignedURLVerification(valid=False, error=f"Invalid platform: {platform}")
 
-        # Check if nonce already used
-        if self._nonce_storage:
-            if await self._nonce_storage.is_nonce_used(nonce):
-                return SignedURLVerification(valid=False, error="URL already used (nonce consumed)")
-
         # Verify signature
-        expected_sig = self._compute_signature(arxiv_id, platform, timestamp, nonce, notifier_id)
+        # Reason: Runs before the nonce storage call so forged URLs are rejected
+        # in CPU time and can't force a database (or D1 network) round trip
+        mac = self._sign(arxiv_id, platform, timestamp, nonce, notifier_id)
+        if len(signature) == _LEGACY_SIGNATURE_LENGTH:
+            # Reason: Links sent before signatures were shortened carry the full
+            # hex digest; accept them until they expire
+            expected_sig = mac.hexdigest()
+        else:
+            expected_sig = _b64url(mac.digest()[:_SIGNATURE_BYTES])
 
         # Constant-time comparison (prevent timing attacks)
         if not hmac.compare_digest(signature, expected_sig):
             return SignedURLVerification(valid=False, error="Invalid signature")
 
+        # Consume nonce (one-time use, prevents replay)
+        if self._nonce_storage:
+            if not await self._nonce_storage.try_consume_nonce(nonce, arxiv_id, platform):
+                return SignedURLVerification(valid=False, error="URL already used (nonce consumed)")
+
         return SignedURLVerification(valid=True, arxiv_id=arxiv_id, platform=platform)
 
     def _compute_signature(self, arxiv_id: str, platform: str, timestamp: int, nonce: str, notifier_id: str | None = None) -> str:
-        """Compute HMAC-SHA256 signature.
+        """Compute truncated HMAC-SHA256 signature.
 
         Args:
             arxiv_id: arXiv paper ID.
@@ -292,19 +348,32 @@ class SignedURLGenerator:
             notifier_id: Optional unique notifier instance ID.
 
         Returns:
-            Hex-encoded HMAC signature.
+            Base64url-encoded first 128 bits of the HMAC (22 chars).
+
+        Reason: A 128-bit tag is still unforgeable within the URL lifetime and
+        keeps links short enough for Telegram and Feishu button payloads.
         """
+        mac = self._sign(arxiv_id, platform, timestamp, nonce, notifier_id)
+        return _b64url(mac.digest()[:_SIGNATURE_BYTES])
+
+    def _sign(
+        self, arxiv_id: str, platform: str, timestamp: int, nonce: str, notifier_id: str | None
+    ) -> hmac.HMAC:
+        """Compute the HMAC-SHA256 over the canonical parameter string."""
         # Canonical string includes all parameters
         # Reason: Including nonce and notifier_id in signature prevents tampering
         canonical = f"{arxiv_id}|{platform}|{timestamp}|{nonce}"
         if notifier_id:
             canonical += f"|{notifier_id}"
 
-        return hmac.new(
-            key=self._secret.encode("utf-8"),
-            msg=canonical.encode("utf-8"),
-            digestmod=hashlib.sha256,
-        ).hexdigest()
+        mac = self._mac.copy()
+        mac.update(canonical.encode("utf-8"))
+        return mac
+
+
+def _b64url(data: bytes) -> str:
+    """Encode bytes as unpadded base64url."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
 
 # Global instance (initialized lazily)
@@ -358,6 +427,7 @@ def get_url_generator() -> SignedURLGenerator:
             secret=settings.signed_url_secret.get_secret_value(),
             expiry_hours=settings.signed_url_expiry_hours,
             nonce_storage=nonce_storage,
+            base_url=settings.api_base_url,
         )
 
         logger.info(
@@ -366,3 +436,20 @@ def get_url_generator() -> SignedURLGenerator:
         )
 
     return _url_generator
+
+
+async def close_url_generator() -> None:
+    """Release nonce storage resources held by the global URL generator.
+
+    Reason: Called on application shutdown; the generator keeps a long-lived
+    connection to its nonce storage.
+    """
+    global _url_generator
+
+    if _url_generator is None:
+        return
+
+    nonce_storage = _url_generator._nonce_storage
+    if nonce_storage is not None and hasattr(nonce_storage, "close"):
+        await nonce_storage.close()
+    _url_generator = None
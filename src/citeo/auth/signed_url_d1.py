@@ -4,12 +4,19 @@ Provides nonce tracking using Cloudflare D1 database.
 """
 
 import time
+from collections import OrderedDict
 
 import httpx
 import structlog
 
 logger = structlog.get_logger()
 
+# Rows removed per DELETE statement when purging expired nonces
+_CLEANUP_BATCH_SIZE = 1000
+
+# Nonces this process has seen consumed, remembered to answer replays locally
+_CONSUMED_CACHE_MAX = 4096
+
 
 class D1NonceStorage:
     """Manage one-time-use nonce state with Cloudflare D1 storage.
@@ -33,6 +40,32 @@ class D1NonceStorage:
             f"https://api.cloudflare.com/client/v4/accounts/{account_id}/"
             f"d1/database/{database_id}/query"
         )
+        self._initialized = False
+        self._client: httpx.AsyncClient | None = None
+        # Reason: Repeat clicks on the same link are the common replay; a nonce
+        # known to be consumed can be rejected without a D1 round trip. This is
+        # an exact set, not a Bloom filter: a false "maybe used" would reject a
+        # fresh link, and the INSERT remains the source of truth otherwise.
+        self._consumed: OrderedDict[str, None] = OrderedDict()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create HTTP client.
+
+        Reason: Reusing one client keeps the connection to the D1 API alive
+        instead of paying a TCP + TLS handshake on every nonce operation.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Bearer {self._api_token}",
+                    "Content-Type": "application/json",
+                },
+                timeout=10.0,
+                # Reason: Nonce operations are bursty (users click shortly after a
+                # notification goes out); keep connections warm between bursts
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+            )
+        return self._client
 
     async def _execute_query(self, sql: str, params: list | None = None) -> dict:
         """Execute SQL query against D1 database.
@@ -47,32 +80,32 @@ class D1NonceStorage:
         Raises:
             httpx.HTTPError: If API request fails.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self._base_url,
-                headers={
-                    "Authorization": f"Bearer {self._api_token}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "sql": sql,
-                    "params": params or [],
-                },
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = await self._get_client()
+        response = await client.post(
+            self._base_url,
+            json={
+                "sql": sql,
+                "params": params or [],
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            if not data.get("success"):
-                errors = data.get("errors", [])
-                error_msg = errors[0].get("message") if errors else "Unknown error"
-                raise RuntimeError(f"D1 query failed: {error_msg}")
+        if not data.get("success"):
+            errors = data.get("errors", [])
+            error_msg = errors[0].get("message") if errors else "Unknown error"
+            raise RuntimeError(f"D1 query failed: {error_msg}")
 
-            return data.get("result", [{}])[0]
+        return data.get("result", [{}])[0]
 
     async def _init_table(self) -> None:
-        """Create nonce table if it doesn't exist."""
+        """Create nonce table if it doesn't exist (once per instance)."""
+        if self._initialized:
+            return
+
         try:
+            # Reason: D1 runs semicolon-separated statements from one request,
+            # so table and index creation cost a single round trip
             await self._execute_query(
                 """
                 CREATE TABLE IF NOT EXISTS signed_url_nonces (
@@ -81,85 +114,66 @@ class D1NonceStorage:
                     consumed_at INTEGER,
                     arxiv_id TEXT NOT NULL,
                     platform TEXT NOT NULL
-                )
-                """
-            )
-
-            # Create index for cleanup queries
-            await self._execute_query(
-                """
+                ) WITHOUT ROWID;
                 CREATE INDEX IF NOT EXISTS idx_nonces_created_at
-                ON signed_url_nonces(created_at)
+                ON signed_url_nonces(created_at);
                 """
             )
 
+            self._initialized = True
             logger.debug("D1 nonce table initialized")
 
         except Exception as e:
             logger.error("Failed to initialize D1 nonce table", error=str(e))
             raise
 
-    async def is_nonce_used(self, nonce: str) -> bool:
-        """Check if a nonce has been used.
+    async def try_consume_nonce(self, nonce: str, arxiv_id: str, platform: str) -> bool:
+        """Atomically mark a nonce as used if it hasn't been used yet.
 
         Args:
-            nonce: The nonce to check.
-
-        Returns:
-            True if nonce exists (already used), False otherwise.
-        """
-        await self._init_table()
-
-        try:
-            result = await self._execute_query(
-                "SELECT consumed_at FROM signed_url_nonces WHERE nonce = ?",
-                [nonce],
-            )
-
-            # Check if result has rows
-            results = result.get("results", [])
-            return len(results) > 0
-
-        except Exception as e:
-            logger.error("Failed to check nonce", nonce=nonce, error=str(e))
-            # Fail safe: assume nonce is used to prevent replay
-            return True
-
-    async def mark_nonce_used(self, nonce: str, arxiv_id: str, platform: str) -> bool:
-        """Mark a nonce as used.
-
-        Args:
-            nonce: The nonce to mark as used.
+            nonce: The nonce to consume.
             arxiv_id: Associated arXiv paper ID.
             platform: Platform that triggered the request.
 
         Returns:
-            True if successfully marked, False if already exists.
+            True if the nonce was consumed by this call, False if already used.
         """
+        if nonce in self._consumed:
+            logger.warning("Nonce already used", nonce=nonce)
+            return False
+
         await self._init_table()
 
         now = int(time.time())
 
         try:
-            await self._execute_query(
+            result = await self._execute_query(
                 """
-                INSERT INTO signed_url_nonces
+                INSERT OR IGNORE INTO signed_url_nonces
                 (nonce, created_at, consumed_at, arxiv_id, platform)
                 VALUES (?, ?, ?, ?, ?)
                 """,
                 [nonce, now, now, arxiv_id, platform],
             )
-            return True
 
         except Exception as e:
-            # Check if it's a constraint violation (nonce already exists)
-            error_msg = str(e)
-            if "UNIQUE constraint" in error_msg or "PRIMARY KEY" in error_msg:
-                logger.warning("Nonce already used", nonce=nonce)
-                return False
+            logger.error("Failed to consume nonce", nonce=nonce, error=str(e))
+            # Fail safe: treat nonce as used to prevent replay
+            return False
+
+        self._remember_consumed(nonce)
 
-            logger.error("Failed to mark nonce as used", nonce=nonce, error=error_msg)
+        # D1 returns meta with changes count
+        if result.get("meta", {}).get("changes", 0) == 0:
+            logger.warning("Nonce already used", nonce=nonce)
             return False
+        return True
+
+    def _remember_consumed(self, nonce: str) -> None:
+        """Record a consumed nonce, evicting the oldest beyond the cache bound."""
+        self._consumed[nonce] = None
+        if len(self._consumed) > _CONSUMED_CACHE_MAX:
+            self._consumed.popitem(last=False)
 
     async def cleanup_expired_nonces(self, expiry_hours: int = 168) -> int:
         """Remove expired nonces from storage.
@@ -174,20 +188,35 @@ class D1NonceStorage:
 
         cutoff = int(time.time()) - (expiry_hours * 3600)
 
+        # Reason: Bounded batches keep each D1 request well under its time limit
+        deleted = 0
         try:
-            result = await self._execute_query(
-                "DELETE FROM signed_url_nonces WHERE created_at < ?",
-                [cutoff],
-            )
-
-            # D1 returns meta with changes count
-            deleted = result.get("meta", {}).get("changes", 0)
-
-            if deleted > 0:
-                logger.info("Cleaned up expired nonces", count=deleted)
+            while True:
+                result = await self._execute_query(
+                    """
+                    DELETE FROM signed_url_nonces WHERE nonce IN (
+                        SELECT nonce FROM signed_url_nonces WHERE created_at < ? LIMIT ?
+                    )
+                    """,
+                    [cutoff, _CLEANUP_BATCH_SIZE],
+                )
 
-            return deleted
+                # D1 returns meta with changes count
+                changes = result.get("meta", {}).get("changes", 0)
+                if changes <= 0:
+                    break
+                deleted += changes
 
         except Exception as e:
             logger.error("Failed to cleanup nonces", error=str(e))
-            return 0
+
+        if deleted > 0:
+            logger.info("Cleaned up expired nonces", count=deleted)
+
+        return deleted
+
+    async def close(self) -> None:
+        """Close HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
@@ -5,7 +5,8 @@ Simple in-memory implementation suitable for single-instance deployment.
 For production with multiple instances, use Redis or database.
 """
 
-from dataclasses import dataclass
+import logging
+import time
 from datetime import datetime
 from typing import Protocol
 
@@ -14,25 +15,6 @@ import structlog
 logger = structlog.get_logger()
 
 
-@dataclass
-class RefreshTokenRecord:
-    """Refresh token record.
-
-    Attributes:
-        token_id: Unique token identifier (jti claim).
-        user_id: User identifier.
-        created_at: Token creation timestamp.
-        expires_at: Token expiration timestamp.
-        revoked: Whether token has been revoked.
-    """
-
-    token_id: str
-    user_id: str
-    created_at: datetime
-    expires_at: datetime
-    revoked: bool = False
-
-
 class TokenStorage(Protocol):
     """Token storage interface.
 
@@ -102,12 +84,25 @@ class InMemoryTokenStorage:
 
     Reason: Simple implementation suitable for single-instance deployment.
     All tokens are lost on restart, which is acceptable for refresh tokens.
+
+    Note: Token fields are kept as parallel dicts keyed by token_id (one per
+    field) rather than one record object per token, so sweeps over a single
+    field iterate a plain dict. Timestamps are stored as Unix seconds.
     """
 
     def __init__(self) -> None:
         """Initialize empty token storage."""
-        # Dict of token_id -> RefreshTokenRecord
-        self._tokens: dict[str, RefreshTokenRecord] = {}
+        # token_id -> user_id
+        self._user_id: dict[str, str] = {}
+        # token_id -> expiry / creation time (Unix seconds)
+        self._expires_at: dict[str, float] = {}
+        self._created_at: dict[str, float] = {}
+        # Revoked token_ids (still stored until they expire)
+        self._revoked: set[str] = set()
+        # user_id -> token_ids, so per-user operations don't scan every token
+        self._by_user: dict[str, set[str]] = {}
+        # Expiry hour (Unix seconds // 3600) -> token_ids expiring in that hour
+        self._expiry_buckets: dict[int, set[str]] = {}
 
     async def store_refresh_token(
         self,
@@ -116,72 +111,87 @@ class InMemoryTokenStorage:
         expires_at: datetime,
     ) -> None:
         """Store a refresh token record."""
-        record = RefreshTokenRecord(
-            token_id=token_id,
-            user_id=user_id,
-            created_at=datetime.utcnow(),
-            expires_at=expires_at,
-            revoked=False,
-        )
-        self._tokens[token_id] = record
-        logger.debug(
-            "Refresh token stored",
-            token_id=token_id,
-            user_id=user_id,
-            expires_at=expires_at.isoformat(),
-        )
+        previous_user = self._user_id.get(token_id)
+        if previous_user is not None and previous_user != user_id:
+            self._unindex_user(previous_user, token_id)
+        previous_expiry = self._expires_at.get(token_id)
+        if previous_expiry is not None:
+            self._unindex_expiry(previous_expiry, token_id)
+        self._user_id[token_id] = user_id
+        self._by_user.setdefault(user_id, set()).add(token_id)
+        self._expires_at[token_id] = expiry = expires_at.timestamp()
+        self._expiry_buckets.setdefault(_expiry_bucket(expiry), set()).add(token_id)
+        self._created_at[token_id] = time.time()
+        self._revoked.discard(token_id)
+        # Reason: Arguments are evaluated even when debug is filtered out
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Refresh token stored",
+                token_id=token_id,
+                user_id=user_id,
+                expires_at=expires_at.isoformat(),
+            )
 
     async def is_token_valid(self, token_id: str) -> bool:
         """Check if a refresh token is valid."""
-        record = self._tokens.get(token_id)
-        if not record:
-            logger.debug("Token not found", token_id=token_id)
+        expires_at = self._expires_at.get(token_id)
+        if expires_at is None:
             return False
 
         # Check if revoked
-        if record.revoked:
+        if token_id in self._revoked:
             logger.warning("Token is revoked", token_id=token_id)
             return False
 
         # Check if expired
-        now = datetime.utcnow()
-        if now > record.expires_at:
-            logger.debug("Token expired", token_id=token_id)
+        if time.time() > expires_at:
             return False
 
         return True
 
     async def revoke_token(self, token_id: str) -> bool:
         """Revoke a refresh token."""
-        record = self._tokens.get(token_id)
-        if not record:
+        user_id = self._user_id.get(token_id)
+        if user_id is None:
             logger.warning("Token not found for revocation", token_id=token_id)
             return False
 
-        record.revoked = True
-        logger.info("Token revoked", token_id=token_id, user_id=record.user_id)
+        self._revoked.add(token_id)
+        logger.info("Token revoked", token_id=token_id, user_id=user_id)
         return True
 
     async def revoke_user_tokens(self, user_id: str) -> int:
         """Revoke all refresh tokens for a user."""
-        count = 0
-        for record in self._tokens.values():
-            if record.user_id == user_id and not record.revoked:
-                record.revoked = True
-                count += 1
+        token_ids = self._by_user.get(user_id, set()) - self._revoked
+        self._revoked.update(token_ids)
 
-        logger.info("User tokens revoked", user_id=user_id, count=count)
-        return count
+        logger.info("User tokens revoked", user_id=user_id, count=len(token_ids))
+        return len(token_ids)
 
     async def cleanup_expired(self) -> int:
-        """Remove expired tokens from storage."""
-        now = datetime.utcnow()
-        expired_ids = [
-            token_id for token_id, record in self._tokens.items() if now > record.expires_at
-        ]
+        """Remove expired tokens from storage.
+
+        Reason: Only tokens in hour buckets up to the current one are touched,
+        so a sweep costs O(expired) rather than a scan of every stored token.
+        """
+        now = time.time()
+        current = _expiry_bucket(now)
+
+        expired_ids: list[str] = []
+        for bucket in [b for b in self._expiry_buckets if b < current]:
+            expired_ids.extend(self._expiry_buckets.pop(bucket))
+        # The current hour's bucket is only partly expired
+        expired_ids.extend(
+            token_id
+            for token_id in self._expiry_buckets.get(current, ())
+            if now > self._expires_at[token_id]
+        )
 
         for token_id in expired_ids:
-            del self._tokens[token_id]
+            self._unindex_user(self._user_id.pop(token_id), token_id)
+            self._unindex_expiry(self._expires_at.pop(token_id), token_id)
+            del self._created_at[token_id]
+            self._revoked.discard(token_id)
 
         if expired_ids:
             logger.info("Expired tokens cleaned up", count=len(expired_ids))
@@ -190,11 +200,33 @@ class InMemoryTokenStorage:
 
     def get_token_count(self) -> int:
         """Get total number of stored tokens (for monitoring)."""
-        return len(self._tokens)
+        return len(self._user_id)
 
     def get_user_token_count(self, user_id: str) -> int:
         """Get number of tokens for a specific user."""
-        return sum(1 for r in self._tokens.values() if r.user_id == user_id)
+        return len(self._by_user.get(user_id, ()))
+
+    def _unindex_expiry(self, expires_at: float, token_id: str) -> None:
+        """Remove a token from its expiry bucket, dropping the bucket when empty."""
+        bucket = _expiry_bucket(expires_at)
+        token_ids = self._expiry_buckets.get(bucket)
+        if token_ids is not None:
+            token_ids.discard(token_id)
+            if not token_ids:
+                del self._expiry_buckets[bucket]
+
+    def _unindex_user(self, user_id: str, token_id: str) -> None:
+        """Remove a token from a user's index entry, dropping the entry when empty."""
+        token_ids = self._by_user.get(user_id)
+        if token_ids is not None:
+            token_ids.discard(token_id)
+            if not token_ids:
+                del self._by_user[user_id]
+
+
+def _expiry_bucket(timestamp: float) -> int:
+    """Map a Unix timestamp to its expiry bucket (hour number)."""
+    return int(timestamp) // 3600
 
 
 # Global token storage instance
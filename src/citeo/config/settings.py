@@ -4,6 +4,7 @@ Supports environment variables and .env file loading.
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field, SecretStr, field_validator
@@ -88,8 +89,8 @@ class Settings(BaseSettings):
     )
 
     # Notifier selection (supports multiple: "telegram,feishu")
-    notifier_types: list[str] = Field(
-        default=["telegram"],
+    notifier_types: tuple[str, ...] = Field(
+        default=("telegram",),
         description="Notification channels to use (comma-separated)",
     )
 
@@ -100,6 +101,12 @@ class Settings(BaseSettings):
         description='JSON array of channel configs, e.g. [{"type":"feishu","webhook_url":"..."}]',
     )
 
+    @field_validator("notifier_types", mode="after")
+    @classmethod
+    def normalize_notifier_types(cls, v: tuple[str, ...]) -> tuple[str, ...]:
+        """Normalize notifier type names once at load time."""
+        return tuple(t.strip().lower() for t in v)
+
     @field_validator("notifier_channels", mode="before")
     @classmethod
     def parse_notifier_channels(cls, v):
@@ -216,8 +223,27 @@ class Settings(BaseSettings):
         ge=1,
         description="Max view requests per IP per minute",
     )
+    trusted_proxies: list[str] = Field(
+        default=[],
+        description="Reverse proxy IPs whose X-Forwarded-For header is trusted (JSON array)",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, loading them on first call.
+
+    Reason: Settings are loaded once and shared across the application;
+    tests can reload them with get_settings.cache_clear().
+    """
+    return Settings()
 
 
-# Global singleton instance
-# Reason: Settings are loaded once and shared across the application
-settings = Settings()
+def __getattr__(name: str) -> Settings:
+    # Reason: Keeps `from citeo.config.settings import settings` working and
+    # returns the same cached instance as get_settings(). This does not defer
+    # loading: modules that import `settings` at top level (routes, auth,
+    # ai.agents) still build it at import time.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,27 +7,27 @@ scheduler and optional API server.
 import argparse
 import asyncio
 import logging
-import sys
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-import uvicorn
-from fastapi import FastAPI
+import httpx
 
-# Add project root to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
-from citeo.api import admin_api_router, admin_page_router, init_services, router
-from citeo.api.auth_routes import router as auth_router
-from citeo.config.settings import settings
+from citeo.config.settings import Settings, get_settings
 from citeo.notifiers import create_notifier, create_notifiers_from_channels
 from citeo.parsers.arxiv_parser import ArxivParser
 from citeo.scheduler import create_scheduler, run_once
 from citeo.services.paper_service import PaperService
 from citeo.sources.arxiv import ArxivFeedSource
-from citeo.storage import create_storage
+from citeo.storage import PaperStorage, create_storage
+from citeo.utils.http_client import create_http_client
 from citeo.utils.logger import configure_logging, get_logger
 
+# Reason: FastAPI, uvicorn and the API package are imported only by the server
+# code paths, so --run-once / --fetch-only don't pay for loading them
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
 
 class HealthCheckFilter(logging.Filter):
     """Filter out successful health check requests from access logs.
@@ -51,6 +51,7 @@ def _create_notifier():
     """
     from citeo.auth.signed_url import get_url_generator
 
+    settings = get_settings()
     logger = get_logger("notifier")
 
     # Initialize URL generator if configured
@@ -88,37 +89,49 @@ def _create_notifier():
     )
 
 
+def _create_sources(settings: Settings, client: httpx.AsyncClient) -> list[ArxivFeedSource]:
+    """Create one feed source per configured feed URL, sharing an HTTP client."""
+    # Reason: Read settings once instead of per feed through the model's attribute access
+    timeout = settings.rss_fetch_timeout
+    user_agent = settings.rss_user_agent
+    return [
+        ArxivFeedSource(url=url, timeout=timeout, user_agent=user_agent, client=client)
+        for url in settings.feed_urls
+    ]
+
+
 @asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan manager.
+async def build_service_graph(
+    settings: Settings, fetch_only: bool = False
+) -> AsyncIterator[tuple[PaperService, PaperStorage]]:
+    """Build the storage, feed sources and paper service shared by both entry points.
 
-    Handles startup and shutdown of scheduler and services.
+    Tears down the notifier, feed HTTP client and storage on exit.
+
+    Args:
+        settings: Application settings.
+        fetch_only: Skip notifier setup (no notifications will be sent).
+
+    Yields:
+        The paper service and its initialized storage.
     """
-    logger = get_logger("lifespan")
-    logger.info("Starting Citeo application")
+    logger = get_logger("services")
 
-    # Initialize storage
     storage = create_storage(settings)
     await storage.initialize()
     logger.info("Storage initialized", db_type=settings.db_type)
 
-    # Initialize API services
-    init_services(settings)
-
-    # Create paper service
-    sources = [
-        ArxivFeedSource(
-            url=url,
-            timeout=settings.rss_fetch_timeout,
-            user_agent=settings.rss_user_agent,
-        )
-        for url in settings.feed_urls
-    ]
-    parser = ArxivParser()
-    notifier = _create_notifier()
+    # Reason: One pooled client for all feeds instead of a new connection per fetch
+    feed_client = create_http_client(
+        timeout=settings.rss_fetch_timeout,
+        user_agent=settings.rss_user_agent,
+        follow_redirects=False,
+    )
+    # Reason: Fetch-only runs send nothing, so skip notifier and signed URL setup
+    notifier = None if fetch_only else _create_notifier()
     paper_service = PaperService(
-        sources=sources,
-        parser=parser,
+        sources=_create_sources(settings, feed_client),
+        parser=ArxivParser(),
         storage=storage,
         notifier=notifier,
         enable_translation=settings.enable_translation,
@@ -127,30 +140,66 @@ async def lifespan(app: FastAPI):
         max_daily_notifications=settings.max_daily_notifications,
     )
 
-    # Create and start scheduler
-    scheduler = create_scheduler(
-        paper_service,
-        hour=settings.daily_fetch_hour,
-        minute=settings.daily_fetch_minute,
-    )
-    scheduler.start()
-    logger.info("Scheduler started")
+    try:
+        yield paper_service, storage
+    finally:
+        if notifier is not None:
+            await notifier.close()
+        await feed_client.aclose()
+        await storage.close()
+
+
+@asynccontextmanager
+async def lifespan(app: "FastAPI"):
+    """Application lifespan manager.
+
+    Handles startup and shutdown of scheduler and services.
+    """
+    from citeo.api import close_services, init_services
+    from citeo.auth.signed_url import close_url_generator
+
+    settings = get_settings()
+    logger = get_logger("lifespan")
+    logger.info("Starting Citeo application")
+
+    async with build_service_graph(settings) as (paper_service, storage):
+        # Initialize API services
+        init_services(settings)
+
+        # Create and start scheduler
+        scheduler = create_scheduler(
+            paper_service,
+            hour=settings.daily_fetch_hour,
+            minute=settings.daily_fetch_minute,
+        )
+        scheduler.start()
+        logger.info("Scheduler started")
 
-    # Store in app state for access in routes
-    app.state.paper_service = paper_service
-    app.state.storage = storage
-    app.state.scheduler = scheduler
+        # Store in app state for access in routes
+        app.state.paper_service = paper_service
+        app.state.storage = storage
+        app.state.scheduler = scheduler
 
-    yield
+        yield
 
-    # Shutdown
-    scheduler.shutdown()
-    await storage.close()
+        # Shutdown
+        scheduler.shutdown()
+        await close_services()
+
+    await close_url_generator()
     logger.info("Citeo application stopped")
 
 
-def create_app() -> FastAPI:
+def create_app() -> "FastAPI":
     """Create FastAPI application."""
+    from fastapi import FastAPI
+
+    from citeo.api import admin_api_router, admin_page_router, router
+    from citeo.api.auth_routes import router as auth_router
+    from citeo.api.middleware import RateLimitMiddleware
+    from citeo.api.routes import view_rate_limiter
+
+    settings = get_settings()
     app = FastAPI(
         title="Citeo API",
         description="arXiv RSS subscription with AI summarization",
@@ -161,43 +210,35 @@ def create_app() -> FastAPI:
     app.include_router(admin_page_router)
     app.include_router(admin_api_router)
     app.include_router(auth_router)
-    return app
-
 
-async def run_cli_once():
-    """Run pipeline once via CLI without API server."""
-    logger = get_logger("cli")
-    logger.info("Running one-time pipeline")
+    # Reason: Public view/export endpoints share one per-IP budget, enforced
+    # before routing so rejected requests never reach the handlers
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules={
+            "/api/view/": view_rate_limiter,
+            "/api/export/": view_rate_limiter,
+        },
+        trusted_proxies=settings.trusted_proxies,
+    )
+    return app
 
-    # Initialize components
-    storage = create_storage(settings)
-    await storage.initialize()
 
-    sources = [
-        ArxivFeedSource(
-            url=url,
-            timeout=settings.rss_fetch_timeout,
-            user_agent=settings.rss_user_agent,
-        )
-        for url in settings.feed_urls
-    ]
-    parser = ArxivParser()
-    notifier = _create_notifier()
-    paper_service = PaperService(
-        sources=sources,
-        parser=parser,
-        storage=storage,
-        notifier=notifier,
-        enable_translation=settings.enable_translation,
-        max_concurrent_ai=settings.ai_max_concurrent,
-        min_notification_score=settings.min_notification_score,
-        max_daily_notifications=settings.max_daily_notifications,
-    )
+async def run_cli_once(fetch_only: bool = False):
+    """Run pipeline once via CLI without API server.
 
-    # Run pipeline
-    stats = await run_once(paper_service)
+    Args:
+        fetch_only: Only fetch and save papers (no AI processing or notifications).
+    """
+    settings = get_settings()
+    logger = get_logger("cli")
+    logger.info("Running one-time pipeline", fetch_only=fetch_only)
 
-    await storage.close()
+    async with build_service_graph(settings, fetch_only=fetch_only) as (paper_service, _):
+        if fetch_only:
+            stats = await paper_service.fetch_only()
+        else:
+            stats = await run_once(paper_service)
 
     logger.info("Pipeline completed", **stats)
     return stats
@@ -205,6 +246,7 @@ async def run_cli_once():
 
 def main():
     """Main entry point."""
+    settings = get_settings()
     parser = argparse.ArgumentParser(description="Citeo - arXiv RSS with AI")
     parser.add_argument(
         "--run-once",
@@ -237,13 +279,15 @@ def main():
 
     if args.run_once or args.fetch_only:
         # Run once and exit
-        asyncio.run(run_cli_once())
+        asyncio.run(run_cli_once(fetch_only=args.fetch_only))
     else:
         # Add health check filter to uvicorn access log
         # Reason: Suppress noisy health check logs (every 30s)
         logging.getLogger("uvicorn.access").addFilter(HealthCheckFilter())
 
         # Start API server with scheduler
+        import uvicorn
+
         app = create_app()
         uvicorn.run(
             app,
@@ -1,11 +1,12 @@
 """Models package."""
 
 from citeo.models.feed import FeedCollection, FeedConfig
-from citeo.models.paper import Paper, PaperSummary
+from citeo.models.paper import PAPER_LIST_ADAPTER, Paper, PaperSummary
 
 __all__ = [
     "Paper",
     "PaperSummary",
+    "PAPER_LIST_ADAPTER",
     "FeedConfig",
     "FeedCollection",
 ]
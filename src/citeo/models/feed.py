@@ -1,11 +1,15 @@
 """Feed configuration models."""
 
-from pydantic import BaseModel, Field, HttpUrl
+from functools import cached_property
+
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class FeedConfig(BaseModel):
     """RSS feed source configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     source_id: str = Field(..., description="Unique source identifier")
     name: str = Field(..., description="Human-readable name")
     url: HttpUrl = Field(..., description="RSS feed URL")
@@ -30,8 +34,12 @@ class FeedConfig(BaseModel):
 class FeedCollection(BaseModel):
     """Collection of feed configurations."""
 
-    feeds: list[FeedConfig] = Field(default_factory=list)
+    # Reason: Frozen with a tuple of feeds so the cached enabled_feeds can't go stale
+    model_config = ConfigDict(frozen=True)
+
+    feeds: tuple[FeedConfig, ...] = Field(default_factory=tuple)
 
-    def get_enabled_feeds(self) -> list[FeedConfig]:
-        """Return only enabled feeds."""
-        return [f for f in self.feeds if f.enabled]
+    @cached_property
+    def enabled_feeds(self) -> tuple[FeedConfig, ...]:
+        """Return only enabled feeds, computed once per collection."""
+        return tuple(f for f in self.feeds if f.enabled)
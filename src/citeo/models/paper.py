@@ -1,8 +1,47 @@
 """Paper data models for arXiv papers and AI-generated summaries."""
 
-from datetime import datetime
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from functools import cached_property
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, TypeAdapter, computed_field
+
+# Timestamp shared by all models created inside batch_timestamp()
+_batch_now: ContextVar[datetime | None] = ContextVar("_batch_now", default=None)
+
+
+def utc_now() -> datetime:
+    """Get the current UTC time as a naive datetime.
+
+    Returns the pinned batch time inside batch_timestamp().
+
+    Reason: Timestamps are stored and compared as naive UTC throughout
+    storage; this replaces the deprecated datetime.utcnow() with the same result.
+    """
+    pinned = _batch_now.get()
+    if pinned is not None:
+        return pinned
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+@contextmanager
+def batch_timestamp() -> Iterator[datetime]:
+    """Pin utc_now() to a single instant for a batch of model constructions.
+
+    Reason: Papers parsed from one feed are created in a tight loop and
+    should share one fetched_at, without reading the clock per paper.
+
+    Yields:
+        The pinned timestamp.
+    """
+    now = datetime.now(UTC).replace(tzinfo=None)
+    token = _batch_now.set(now)
+    try:
+        yield now
+    finally:
+        _batch_now.reset(token)
 
 
 class PaperSummary(BaseModel):
@@ -23,10 +62,14 @@ class PaperSummary(BaseModel):
         le=10.0,
         description="Programmer recommendation score for sorting (1-10)",
     )
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = Field(default_factory=utc_now)
 
     # Optional: PDF deep analysis result
     deep_analysis: str | None = Field(default=None)
+    deep_analysis_html: str | None = Field(
+        default=None,
+        description="Deep analysis rendered to HTML when stored (for web view)",
+    )
 
 
 class Paper(BaseModel):
@@ -50,7 +93,7 @@ class Paper(BaseModel):
 
     # Metadata
     source_id: str = Field(..., description="Source identifier, e.g., arxiv.cs.AI")
-    fetched_at: datetime = Field(default_factory=datetime.utcnow)
+    fetched_at: datetime = Field(default_factory=utc_now)
 
     # AI processing result (optional, populated after processing)
     summary: PaperSummary | None = Field(default=None)
@@ -60,12 +103,19 @@ class Paper(BaseModel):
     notified_at: datetime | None = Field(default=None)
 
     @computed_field
-    @property
+    @cached_property
     def pdf_url(self) -> str:
         """Compute PDF URL from abs_url.
 
         Reason: PDF URL follows a fixed pattern, no need to store separately.
+        Cached on first access since abs_url is never reassigned; it is read
+        repeatedly for serialization, notifications and prompts.
         """
-        return self.abs_url.replace("/abs/", "/pdf/") + ".pdf"
+        return self.abs_url.replace("/abs/", "/pdf/", 1) + ".pdf"
 
     model_config = {"frozen": False}  # Allow modification (adding summary, etc.)
+
+
+# Reason: Validates a whole feed's entries in one pydantic-core call instead of
+# one Paper(**fields) round trip per entry
+PAPER_LIST_ADAPTER = TypeAdapter(list[Paper])
@@ -22,6 +22,20 @@ class Notifier(Protocol):
         """
         ...
 
+    async def send_papers(
+        self, papers: list[Paper], total_filtered_count: int | None = None
+    ) -> int:
+        """Send notifications for multiple papers.
+
+        Args:
+            papers: List of papers to notify about.
+            total_filtered_count: Total number of high-score papers before truncation.
+
+        Returns:
+            int: Number of successfully sent notifications.
+        """
+        ...
+
     async def send_message(self, message: str) -> bool:
         """Send a plain text message.
 
@@ -43,3 +57,7 @@ class Notifier(Protocol):
             bool: True if notification was sent successfully.
         """
         ...
+
+    async def close(self) -> None:
+        """Release network resources held by the notifier."""
+        ...
@@ -1,5 +1,7 @@
 """Notifier factory for creating notifiers based on configuration."""
 
+from collections.abc import Sequence
+
 import structlog
 
 from citeo.notifiers.base import Notifier
@@ -89,7 +91,7 @@ def create_notifiers_from_channels(
 
 
 def create_notifier(
-    notifier_types: list[str],
+    notifier_types: Sequence[str],
     telegram_token: str | None = None,
     telegram_chat_id: str | None = None,
     feishu_webhook_url: str | None = None,
@@ -99,7 +101,8 @@ def create_notifier(
     """Create notifier(s) based on configuration.
 
     Args:
-        notifier_types: List of notifier types to create ("telegram", "feishu").
+        notifier_types: Notifier types to create ("telegram", "feishu"),
+            already stripped and lowercased by Settings.
         telegram_token: Telegram bot token.
         telegram_chat_id: Telegram chat ID.
         feishu_webhook_url: Feishu webhook URL.
@@ -115,8 +118,6 @@ def create_notifier(
     notifiers: list[Notifier] = []
 
     for ntype in notifier_types:
-        ntype = ntype.strip().lower()
-
         if ntype == "telegram":
             if not telegram_token or not telegram_chat_id:
                 raise ValueError(
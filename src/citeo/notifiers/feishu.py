@@ -13,9 +13,28 @@ import httpx
 import structlog
 
 from citeo.models.paper import Paper
+from citeo.utils.json_utils import dumps_compact
 
 logger = structlog.get_logger()
 
+# Card content limits
+_MAX_KEY_POINTS = 4
+_MAX_CATEGORIES = 3
+_MAX_AUTHORS = 3
+
+# Score emoji indexed by int(score) for scores 0-10
+_SCORE_EMOJI = ("📊",) * 6 + ("⭐", "⭐", "🔥", "🔥🔥", "🔥🔥")
+
+# Reason: Fixed card fragments are shared by reference across cards instead of
+# being rebuilt per paper; cards are only serialized, never mutated
+_HR: dict[str, Any] = {"tag": "hr"}
+_ABSTRACT_TEXT: dict[str, Any] = {"tag": "plain_text", "content": "📄 Abstract"}
+_PDF_TEXT: dict[str, Any] = {"tag": "plain_text", "content": "📥 PDF"}
+_ANALYSIS_TEXT: dict[str, Any] = {"tag": "plain_text", "content": "🔬 深度分析"}
+_VIEW_TEXT: dict[str, Any] = {"tag": "plain_text", "content": "🌐 完整查看"}
+
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
 
 class FeishuNotifier:
     """Feishu Bot webhook notification implementation.
@@ -43,10 +62,33 @@ class FeishuNotifier:
         """
         self._webhook_url = webhook_url
         self._secret = secret
+        # Reason: Feishu keys the HMAC with "timestamp\nsecret", so the key changes
+        # every second; only the secret's encoding can be done up front
+        self._secret_bytes = secret.encode() if secret else b""
         self._rate_limit_delay = rate_limit_delay
         self._url_generator = url_generator
         # Reason: Unique ID enables precise notifier matching in multi-instance setups
         self._notifier_id = notifier_id or hashlib.sha256(f"feishu:{webhook_url}".encode()).hexdigest()[:16]
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Reason: Keep-alive reuse turns each webhook POST after the first into a
+        single round trip instead of a fresh TCP + TLS handshake per message.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _generate_sign(self, timestamp: int) -> str:
         """Generate signature for webhook verification.
@@ -60,12 +102,9 @@ class FeishuNotifier:
         if not self._secret:
             return ""
 
-        string_to_sign = f"{timestamp}\n{self._secret}"
-        hmac_code = hmac.new(
-            string_to_sign.encode("utf-8"),
-            digestmod=hashlib.sha256,
-        ).digest()
-        return base64.b64encode(hmac_code).decode("utf-8")
+        key = b"%d\n" % timestamp + self._secret_bytes
+        hmac_code = hmac.digest(key, b"", "sha256")
+        return base64.b64encode(hmac_code).decode("ascii")
 
     async def _send_request(self, payload: dict[str, Any]) -> bool:
         """Send request to Feishu webhook.
@@ -83,24 +122,23 @@ class FeishuNotifier:
             payload["sign"] = self._generate_sign(timestamp)
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.post(
-                    self._webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
+            response = await self._get_client().post(
+                self._webhook_url,
+                content=dumps_compact(payload).encode(),
+                headers=_JSON_HEADERS,
+            )
+            response.raise_for_status()
+
+            result = response.json()
+            if result.get("code") == 0:
+                return True
+            else:
+                logger.error(
+                    "Feishu API error",
+                    code=result.get("code"),
+                    msg=result.get("msg"),
                 )
-                response.raise_for_status()
-
-                result = response.json()
-                if result.get("code") == 0:
-                    return True
-                else:
-                    logger.error(
-                        "Feishu API error",
-                        code=result.get("code"),
-                        msg=result.get("msg"),
-                    )
-                    return False
+                return False
 
         except httpx.HTTPError as e:
             logger.error("Feishu request failed", error=str(e))
@@ -159,11 +197,18 @@ class FeishuNotifier:
 
         await self.send_message(header_msg)
 
+        # Reason: Papers arrive sorted by score, so they're sent in order, but the
+        # rate-limit delay is measured from each send's start so the webhook round
+        # trip counts toward it instead of being added on top
+        loop = asyncio.get_running_loop()
         success_count = 0
         for paper in papers:
+            started = loop.time()
             if await self.send_paper(paper):
                 success_count += 1
-            await asyncio.sleep(self._rate_limit_delay)
+            remaining = self._rate_limit_delay - (loop.time() - started)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
 
         return success_count
 
@@ -208,29 +253,24 @@ class FeishuNotifier:
         # Key points
         key_points_text = ""
         if summary and summary.key_points:
-            key_points_text = "\n".join(f"• {p}" for p in summary.key_points[:4])
+            key_points_text = "• " + "\n• ".join(summary.key_points[:_MAX_KEY_POINTS])
 
         # Score emoji
         # Reason: Display 1-10 programmer recommendation score
         score_text = ""
         if summary and summary.relevance_score >= 1:
             score = summary.relevance_score
-            if score >= 9:
-                emoji = "🔥🔥"
-            elif score >= 8:
-                emoji = "🔥"
-            elif score >= 6:
-                emoji = "⭐"
-            else:
-                emoji = "📊"
+            emoji = _SCORE_EMOJI[min(int(score), 10)]
             score_text = f"{emoji} 推荐度: {score:.1f}/10"
 
         # Categories
-        categories = " ".join(f"`{cat}`" for cat in paper.categories[:3])
+        categories = ""
+        if paper.categories:
+            categories = "`" + "` `".join(paper.categories[:_MAX_CATEGORIES]) + "`"
 
         # Authors
-        authors = ", ".join(paper.authors[:3])
-        if len(paper.authors) > 3:
+        authors = ", ".join(paper.authors[:_MAX_AUTHORS])
+        if len(paper.authors) > _MAX_AUTHORS:
             authors += f" 等 ({len(paper.authors)}人)"
 
         # Build card elements
@@ -253,7 +293,7 @@ class FeishuNotifier:
             }
         )
 
-        elements.append({"tag": "hr"})
+        elements.append(_HR)
 
         # Abstract
         elements.append(
@@ -265,7 +305,7 @@ class FeishuNotifier:
 
         # Key points
         if key_points_text:
-            elements.append({"tag": "hr"})
+            elements.append(_HR)
             elements.append(
                 {
                     "tag": "markdown",
@@ -286,13 +326,13 @@ class FeishuNotifier:
         actions = [
             {
                 "tag": "button",
-                "text": {"tag": "plain_text", "content": "📄 Abstract"},
+                "text": _ABSTRACT_TEXT,
                 "type": "primary",
                 "url": paper.abs_url,
             },
             {
                 "tag": "button",
-                "text": {"tag": "plain_text", "content": "📥 PDF"},
+                "text": _PDF_TEXT,
                 "type": "default",
                 "url": paper.pdf_url,
             },
@@ -307,7 +347,7 @@ class FeishuNotifier:
                 actions.append(
                     {
                         "tag": "button",
-                        "text": {"tag": "plain_text", "content": "🔬 深度分析"},
+                        "text": _ANALYSIS_TEXT,
                         "type": "danger",  # Red button for emphasis
                         "url": analysis_url,
                     }
@@ -315,7 +355,7 @@ class FeishuNotifier:
             except Exception as e:
                 logger.warning("Failed to generate analysis URL", error=str(e))
 
-        elements.append({"tag": "hr"})
+        elements.append(_HR)
         elements.append({"tag": "action", "actions": actions})
 
         return {
@@ -383,7 +423,7 @@ class FeishuNotifier:
             }
         )
 
-        elements.append({"tag": "hr"})
+        elements.append(_HR)
 
         # Deep analysis content
         elements.append(
@@ -394,7 +434,7 @@ class FeishuNotifier:
         )
 
         # Action buttons
-        elements.append({"tag": "hr"})
+        elements.append(_HR)
 
         # Reason: Add web view button for viewing formatted analysis in browser
         from citeo.config.settings import settings
@@ -407,19 +447,19 @@ class FeishuNotifier:
                 "actions": [
                     {
                         "tag": "button",
-                        "text": {"tag": "plain_text", "content": "📄 Abstract"},
+                        "text": _ABSTRACT_TEXT,
                         "type": "primary",
                         "url": paper.abs_url,
                     },
                     {
                         "tag": "button",
-                        "text": {"tag": "plain_text", "content": "📥 PDF"},
+                        "text": _PDF_TEXT,
                         "type": "default",
                         "url": paper.pdf_url,
                     },
                     {
                         "tag": "button",
-                        "text": {"tag": "plain_text", "content": "🌐 完整查看"},
+                        "text": _VIEW_TEXT,
                         "type": "default",
                         "url": view_url,
                     },
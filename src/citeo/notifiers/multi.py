@@ -80,63 +80,73 @@ class MultiNotifier:
         telegram_notifiers = [n for n in self._notifiers if isinstance(n, TelegramNotifier)]
         other_notifiers = [n for n in self._notifiers if not isinstance(n, TelegramNotifier)]
 
-        results = []
-
-        # Send to Telegram bots sequentially to avoid rate limiting
-        if telegram_notifiers:
-            logger.info(
-                "Sending to Telegram bots sequentially",
-                telegram_count=len(telegram_notifiers),
-            )
+        async def send_telegram_sequentially() -> list[int | BaseException]:
+            # Send to Telegram bots sequentially to avoid rate limiting
+            telegram_results: list[int | BaseException] = []
             for i, notifier in enumerate(telegram_notifiers):
                 try:
-                    result = await notifier.send_papers(papers, total_filtered_count=total_filtered_count)
-                    results.append(result)
+                    result = await notifier.send_papers(
+                        papers, total_filtered_count=total_filtered_count
+                    )
+                    telegram_results.append(result)
                     logger.info(
                         "Telegram notifier sent papers successfully",
                         notifier_index=i,
                         success_count=result,
                     )
                 except Exception as e:
-                    results.append(e)
+                    telegram_results.append(e)
                     logger.error(
                         "Telegram notifier failed to send papers",
                         notifier_index=i,
                         error=str(e),
                     )
+            return telegram_results
 
-        # Send to other platforms in parallel (they don't share rate limits)
+        if telegram_notifiers:
+            logger.info(
+                "Sending to Telegram bots sequentially",
+                telegram_count=len(telegram_notifiers),
+            )
         if other_notifiers:
             logger.info(
                 "Sending to other platforms in parallel",
                 other_count=len(other_notifiers),
             )
-            other_results = await asyncio.gather(
+
+        # Reason: The Telegram chain runs alongside the other platforms instead of
+        # holding them back until every bot has finished its whole batch. Only the
+        # other platforms' gather swallows exceptions (the chain catches its own),
+        # so cancellation still propagates
+        telegram_results, other_results = await asyncio.gather(
+            send_telegram_sequentially(),
+            asyncio.gather(
                 *[
                     n.send_papers(papers, total_filtered_count=total_filtered_count)
                     for n in other_notifiers
                 ],
                 return_exceptions=True,
-            )
-            results.extend(other_results)
-
-            # Log results for other notifiers
-            for i, (notifier, result) in enumerate(zip(other_notifiers, other_results)):
-                notifier_type = type(notifier).__name__
-                if isinstance(result, Exception):
-                    logger.error(
-                        "Notifier failed to send papers",
-                        notifier_index=len(telegram_notifiers) + i,
-                        notifier_type=notifier_type,
-                        error=str(result),
-                    )
-                elif isinstance(result, int):
-                    logger.info(
-                        "Notifier sent papers successfully",
-                        notifier_index=len(telegram_notifiers) + i,
-                        notifier_type=notifier_type,
-                        success_count=result,
-                    )
+            ),
+        )
+        results = [*telegram_results, *other_results]
+
+        # Log results for other notifiers
+        for i, (notifier, result) in enumerate(zip(other_notifiers, other_results)):
+            notifier_type = type(notifier).__name__
+            if isinstance(result, Exception):
+                logger.error(
+                    "Notifier failed to send papers",
+                    notifier_index=len(telegram_notifiers) + i,
+                    notifier_type=notifier_type,
+                    error=str(result),
+                )
+            elif isinstance(result, int):
+                logger.info(
+                    "Notifier sent papers successfully",
+                    notifier_index=len(telegram_notifiers) + i,
+                    notifier_type=notifier_type,
+                    success_count=result,
+                )
 
         # Return the max success count across all notifiers
         success_counts = [r for r in results if isinstance(r, int)]
@@ -186,3 +196,7 @@ class MultiNotifier:
                 logger.warning("Notifier failed to send deep analysis", error=str(e))
 
         return success
+
+    async def close(self) -> None:
+        """Close all channels."""
+        await asyncio.gather(*[n.close() for n in self._notifiers], return_exceptions=True)
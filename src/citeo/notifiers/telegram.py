@@ -14,6 +14,15 @@ from citeo.models.paper import Paper
 
 logger = structlog.get_logger()
 
+# Score emoji indexed by int(score) for scores 0-10
+_SCORE_EMOJI = (
+    ("📄",) * 4  # 1-3: Low relevance
+    + ("📊",) * 2  # 4-5: Moderate interest
+    + ("⭐",) * 2  # 6-7: Worth reading
+    + ("🔥",)  # 8: Highly recommended
+    + ("🔥🔥",) * 2  # 9-10: Must-read for programmers
+)
+
 # Telegram message length limit
 MAX_MESSAGE_LENGTH = 4096
 
@@ -51,6 +60,10 @@ class TelegramNotifier:
         import hashlib
         self._notifier_id = notifier_id or hashlib.sha256(f"telegram:{chat_id}".encode()).hexdigest()[:16]
 
+    async def close(self) -> None:
+        """Shut down the bot's HTTP request handlers."""
+        await self._bot.shutdown()
+
     async def send_paper(self, paper: Paper) -> bool:
         """Send notification for a single paper.
 
@@ -251,16 +264,7 @@ class TelegramNotifier:
 
         Reason: Visual indication of paper's value to programmers.
         """
-        if score >= 9:
-            return "🔥🔥"  # 9-10: Must-read for programmers
-        elif score >= 8:
-            return "🔥"  # 8: Highly recommended
-        elif score >= 6:
-            return "⭐"  # 6-7: Worth reading
-        elif score >= 4:
-            return "📊"  # 4-5: Moderate interest
-        else:
-            return "📄"  # 1-3: Low relevance
+        return _SCORE_EMOJI[min(int(score), 10)]
 
     async def send_deep_analysis(self, paper: Paper) -> bool:
         """Send PDF deep analysis notification for a paper.
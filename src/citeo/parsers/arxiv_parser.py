@@ -2,11 +2,12 @@
 
 import re
 from datetime import datetime
+from typing import Any
 
 import feedparser
 
 from citeo.exceptions import ParseError
-from citeo.models.paper import Paper
+from citeo.models.paper import PAPER_LIST_ADAPTER, Paper, batch_timestamp, utc_now
 
 
 class ArxivParser:
@@ -36,28 +37,30 @@ class ArxivParser:
                 # feedparser sets bozo=1 for any parse issues
                 raise ParseError(source_id, f"Feed parse error: {feed.bozo_exception}")
 
-            papers: list[Paper] = []
-            for entry in feed.entries:
-                paper = self._parse_entry(entry, source_id)
-                if paper:
-                    papers.append(paper)
-
-            return papers
+            items = [
+                fields
+                for entry in feed.entries
+                if (fields := self._parse_entry(entry, source_id)) is not None
+            ]
+            with batch_timestamp():
+                return PAPER_LIST_ADAPTER.validate_python(items)
 
         except ParseError:
             raise
         except Exception as e:
             raise ParseError(source_id, f"Unexpected parse error: {e}") from e
 
-    def _parse_entry(self, entry: feedparser.FeedParserDict, source_id: str) -> Paper | None:
-        """Parse a single feed entry into a Paper object.
+    def _parse_entry(
+        self, entry: feedparser.FeedParserDict, source_id: str
+    ) -> dict[str, Any] | None:
+        """Extract Paper fields from a single feed entry.
 
         Args:
             entry: feedparser entry dict.
             source_id: Source identifier.
 
         Returns:
-            Paper object or None if entry is invalid.
+            Paper field dict, or None if entry is invalid.
         """
         # Extract GUID
         guid = entry.get("id", entry.get("guid", ""))
@@ -93,18 +96,18 @@ class ArxivParser:
         # Build abstract URL
         abs_url = entry.get("link", f"https://arxiv.org/abs/{arxiv_id}")
 
-        return Paper(
-            guid=guid,
-            arxiv_id=arxiv_id,
-            title=title,
-            abstract=abstract,
-            authors=authors,
-            categories=categories,
-            announce_type=announce_type,
-            published_at=published_at,
-            abs_url=abs_url,
-            source_id=source_id,
-        )
+        return {
+            "guid": guid,
+            "arxiv_id": arxiv_id,
+            "title": title,
+            "abstract": abstract,
+            "authors": authors,
+            "categories": categories,
+            "announce_type": announce_type,
+            "published_at": published_at,
+            "abs_url": abs_url,
+            "source_id": source_id,
+        }
 
     def _extract_arxiv_id(self, guid: str) -> str | None:
         """Extract arXiv ID from GUID.
@@ -255,7 +258,7 @@ class ArxivParser:
                 pass
 
         # Fall back to current time
-        return datetime.utcnow()
+        return utc_now()
 
     def _clean_text(self, text: str) -> str:
         """Clean text by normalizing whitespace."""
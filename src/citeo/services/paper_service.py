@@ -11,7 +11,7 @@ import structlog
 from citeo.ai.summarizer import summarize_paper
 from citeo.exceptions import AIProcessingError, FetchError
 from citeo.models.paper import Paper
-from citeo.notifiers.telegram import TelegramNotifier
+from citeo.notifiers.base import Notifier
 from citeo.parsers.arxiv_parser import ArxivParser
 from citeo.sources.arxiv import ArxivFeedSource
 from citeo.storage.base import PaperStorage
@@ -31,7 +31,7 @@ class PaperService:
         sources: list[ArxivFeedSource],
         parser: ArxivParser,
         storage: PaperStorage,
-        notifier: TelegramNotifier,
+        notifier: Notifier | None,
         enable_translation: bool = True,
         max_concurrent_ai: int = 5,
         min_notification_score: float = 8.0,
@@ -43,7 +43,8 @@ class PaperService:
             sources: List of RSS feed sources.
             parser: RSS parser instance.
             storage: Paper storage instance.
-            notifier: Notification sender instance.
+            notifier: Notification sender instance. None for fetch-only use,
+                which never sends notifications.
             enable_translation: Whether to enable AI translation.
             max_concurrent_ai: Maximum concurrent AI processing tasks.
             min_notification_score: Minimum score for notification (1-10).
@@ -186,6 +187,13 @@ class PaperService:
         highly relevant papers for programmers (score >= threshold). Sort by score
         in descending order to show most important papers first.
         """
+        if self._notifier is None:
+            # Reason: Leave papers pending so a run with a notifier still sends them
+            logger.warning(
+                "No notifier configured, skipping notifications", pending_count=len(papers)
+            )
+            return 0
+
         # Filter papers with score >= threshold (only those with AI summary)
         # Reason: Only recommend papers that are highly relevant to programmers
         high_score_papers = [
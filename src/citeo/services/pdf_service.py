@@ -9,6 +9,7 @@ from citeo.ai.pdf_analyzer import analyze_pdf
 from citeo.exceptions import AIProcessingError, PDFDownloadError
 from citeo.notifiers.base import Notifier
 from citeo.storage.base import PaperStorage
+from citeo.utils.markdown_html import render_markdown_html
 
 logger = structlog.get_logger()
 
@@ -71,7 +72,10 @@ class PDFService:
             analysis = await analyze_pdf(arxiv_id, paper.pdf_url)
 
             # Save to storage
-            await self._storage.update_deep_analysis(paper.guid, analysis)
+            # Reason: Render HTML once here so the public web view doesn't
+            # parse Markdown on every request
+            analysis_html = render_markdown_html(analysis)
+            await self._storage.update_deep_analysis(paper.guid, analysis, analysis_html)
 
             log.info("PDF analysis completed")
 
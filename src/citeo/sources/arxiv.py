@@ -18,6 +18,7 @@ class ArxivFeedSource:
         name: str | None = None,
         timeout: int = 30,
         user_agent: str = "Citeo/1.0 (arXiv RSS Reader)",
+        client: httpx.AsyncClient | None = None,
     ):
         """Initialize arXiv feed source.
 
@@ -27,12 +28,14 @@ class ArxivFeedSource:
             name: Human-readable name. Defaults to source_id.
             timeout: Request timeout in seconds.
             user_agent: User-Agent header for requests.
+            client: Shared HTTP client. If omitted, a client is created per fetch.
         """
         self._url = url
         self._source_id = source_id or self._derive_source_id(url)
         self._name = name or self._source_id
         self._timeout = timeout
         self._user_agent = user_agent
+        self._client = client
 
     @property
     def source_id(self) -> str:
@@ -61,10 +64,15 @@ class ArxivFeedSource:
         headers = {"User-Agent": self._user_agent}
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(self._url, headers=headers)
-                response.raise_for_status()
-                return response.text
+            if self._client is not None:
+                # Reason: Feeds share one client so connections (TLS, DNS) to
+                # rss.arxiv.org are reused across categories
+                response = await self._client.get(self._url, headers=headers, timeout=self._timeout)
+            else:
+                async with httpx.AsyncClient(timeout=self._timeout) as client:
+                    response = await client.get(self._url, headers=headers)
+            response.raise_for_status()
+            return response.text
         except httpx.TimeoutException as e:
             raise FetchError(self._source_id, f"Request timed out: {e}") from e
         except httpx.HTTPStatusError as e:
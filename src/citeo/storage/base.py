@@ -57,15 +57,25 @@ class PaperStorage(Protocol):
         self,
         start_date: datetime,
         end_date: datetime,
+        *,
+        sort_order: str = "desc",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[Paper]:
         """Get papers within a date range.
 
         Args:
             start_date: Start of the date range.
             end_date: End of the date range.
+            sort_order: Order by published_at, "asc" or "desc".
+            limit: Maximum number of papers to return (None = all).
+            offset: Number of papers to skip.
 
         Returns:
             List of papers published within the range.
+
+        Reason: Sorting and pagination happen in the database so a page
+        request doesn't load the whole range into memory.
         """
         ...
 
@@ -113,12 +123,18 @@ class PaperStorage(Protocol):
         """
         ...
 
-    async def update_deep_analysis(self, guid: str, analysis: str) -> None:
+    async def update_deep_analysis(
+        self,
+        guid: str,
+        analysis: str,
+        analysis_html: str | None = None,
+    ) -> None:
         """Update a paper's deep analysis result.
 
         Args:
             guid: The paper's GUID.
-            analysis: The deep analysis text.
+            analysis: The deep analysis text (Markdown).
+            analysis_html: The analysis pre-rendered to HTML, if available.
         """
         ...
 
@@ -152,6 +168,51 @@ class PaperStorage(Protocol):
         """
         ...
 
+    async def set_analysis_status(
+        self,
+        arxiv_id: str,
+        status: str,
+        ttl_seconds: int = 1800,
+    ) -> None:
+        """Record the status of a background analysis task.
+
+        Args:
+            arxiv_id: The arXiv identifier.
+            status: Task status (processing, completed, cached, "error: ...").
+            ttl_seconds: Seconds until the status is considered stale.
+
+        Reason: Status lives in storage rather than process memory so that
+        every API worker sees the same in-flight analyses.
+        """
+        ...
+
+    async def try_start_analysis(self, arxiv_id: str, ttl_seconds: int = 1800) -> bool:
+        """Atomically mark an analysis as processing unless one is in flight.
+
+        Args:
+            arxiv_id: The arXiv identifier.
+            ttl_seconds: Seconds until the processing marker is considered stale.
+
+        Returns:
+            True if this caller acquired the marker, False if another
+            unexpired "processing" marker already exists.
+
+        Reason: A separate check-then-set lets concurrent requests enqueue
+        duplicate analyses (and duplicate OpenAI spend).
+        """
+        ...
+
+    async def get_analysis_status(self, arxiv_id: str) -> str | None:
+        """Get the status of a background analysis task.
+
+        Args:
+            arxiv_id: The arXiv identifier.
+
+        Returns:
+            The recorded status, or None if absent or expired.
+        """
+        ...
+
     async def close(self) -> None:
         """Close the storage connection."""
         ...
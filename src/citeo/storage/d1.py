@@ -4,6 +4,7 @@ Provides async D1 storage using Cloudflare REST API.
 """
 
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -11,6 +12,7 @@ import httpx
 import structlog
 
 from citeo.models.paper import Paper, PaperSummary
+from citeo.utils.json_utils import dumps_compact
 
 logger = structlog.get_logger()
 
@@ -124,6 +126,13 @@ class D1PaperStorage:
 
         await self._execute_script(schema_sql)
 
+        # Reason: CREATE TABLE IF NOT EXISTS doesn't add columns to
+        # databases created before deep_analysis_html existed
+        result = await self._execute("PRAGMA table_info(papers)")
+        columns = {row["name"] for row in result.get("results", [])}
+        if "deep_analysis_html" not in columns:
+            await self._execute("ALTER TABLE papers ADD COLUMN deep_analysis_html TEXT")
+
         self._initialized = True
         logger.info("D1 storage initialized")
 
@@ -145,8 +154,8 @@ class D1PaperStorage:
                 paper.arxiv_id,
                 paper.title,
                 paper.abstract,
-                json.dumps(paper.authors),
-                json.dumps(paper.categories),
+                dumps_compact(paper.authors),
+                dumps_compact(paper.categories),
                 paper.announce_type,
                 paper.published_at.isoformat(),
                 paper.abs_url,
@@ -180,16 +189,26 @@ class D1PaperStorage:
         self,
         start_date: datetime,
         end_date: datetime,
+        *,
+        sort_order: str = "desc",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[Paper]:
-        """Get papers within date range."""
-        result = await self._execute(
-            """
+        """Get papers within date range, sorted and paginated in SQL."""
+        # Reason: ORDER BY direction can't be a bound parameter, so whitelist it
+        direction = "ASC" if sort_order == "asc" else "DESC"
+        sql = f"""
             SELECT * FROM papers
             WHERE published_at >= ? AND published_at <= ?
-            ORDER BY published_at DESC
-            """,
-            (start_date.isoformat(), end_date.isoformat()),
-        )
+            ORDER BY published_at {direction}
+            """
+        params: tuple[str | int, ...] = (start_date.isoformat(), end_date.isoformat())
+        if limit is not None or offset:
+            # Reason: SQLite requires LIMIT before OFFSET; -1 means no limit
+            sql += " LIMIT ? OFFSET ?"
+            params += (limit if limit is not None else -1, offset)
+
+        result = await self._execute(sql, params)
 
         rows = result.get("results", [])
         return [self._row_to_paper(row) for row in rows]
@@ -250,7 +269,7 @@ class D1PaperStorage:
             (
                 summary.title_zh,
                 summary.abstract_zh,
-                json.dumps(summary.key_points),
+                dumps_compact(summary.key_points),
                 summary.relevance_score,
                 summary.generated_at.isoformat(),
                 datetime.utcnow().isoformat(),
@@ -258,15 +277,22 @@ class D1PaperStorage:
             ),
         )
 
-    async def update_deep_analysis(self, guid: str, analysis: str) -> None:
+    async def update_deep_analysis(
+        self,
+        guid: str,
+        analysis: str,
+        analysis_html: str | None = None,
+    ) -> None:
         """Update paper's deep analysis result."""
+        now = datetime.utcnow().isoformat()
         await self._execute(
             """
             UPDATE papers
-            SET deep_analysis = ?, deep_analysis_at = ?, updated_at = ?
+            SET deep_analysis = ?, deep_analysis_html = ?,
+                deep_analysis_at = ?, updated_at = ?
             WHERE guid = ?
             """,
-            (analysis, datetime.utcnow().isoformat(), datetime.utcnow().isoformat(), guid),
+            (analysis, analysis_html, now, now, guid),
         )
 
     async def get_papers_by_fetched_date(
@@ -318,6 +344,58 @@ class D1PaperStorage:
                 (now, *batch),
             )
 
+    async def set_analysis_status(
+        self,
+        arxiv_id: str,
+        status: str,
+        ttl_seconds: int = 1800,
+    ) -> None:
+        """Record background analysis status (upsert).
+
+        Reason: Expired rows are purged whenever a task finishes so the table
+        stays bounded to recently analyzed papers.
+        """
+        now = int(time.time())
+        await self._execute(
+            """
+            INSERT INTO analysis_status (arxiv_id, status, expires_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(arxiv_id) DO UPDATE SET
+                status = excluded.status, expires_at = excluded.expires_at
+            """,
+            (arxiv_id, status, now + ttl_seconds),
+        )
+        if status != "processing":
+            await self._execute("DELETE FROM analysis_status WHERE expires_at <= ?", (now,))
+
+    async def try_start_analysis(self, arxiv_id: str, ttl_seconds: int = 1800) -> bool:
+        """Acquire the processing marker in a single conditional upsert."""
+        now = int(time.time())
+        result = await self._execute(
+            """
+            INSERT INTO analysis_status (arxiv_id, status, expires_at)
+            VALUES (?, 'processing', ?)
+            ON CONFLICT(arxiv_id) DO UPDATE SET
+                status = excluded.status, expires_at = excluded.expires_at
+            WHERE analysis_status.status != 'processing'
+                OR analysis_status.expires_at <= ?
+            """,
+            (arxiv_id, now + ttl_seconds, now),
+        )
+
+        changes: int = result.get("meta", {}).get("changes", 0)
+        return changes > 0
+
+    async def get_analysis_status(self, arxiv_id: str) -> str | None:
+        """Get background analysis status, ignoring expired entries."""
+        result = await self._execute(
+            "SELECT status FROM analysis_status WHERE arxiv_id = ? AND expires_at > ?",
+            (arxiv_id, int(time.time())),
+        )
+
+        rows = result.get("results", [])
+        return rows[0]["status"] if rows else None
+
     async def close(self) -> None:
         """Close storage connection."""
         if self._client:
@@ -328,19 +406,22 @@ class D1PaperStorage:
         """Convert D1 result row to Paper object.
 
         Reason: D1 REST API returns results as list of dicts,
-        unlike aiosqlite which returns Row objects.
+        unlike aiosqlite which returns Row objects. Rows were validated when
+        saved, so models are built with model_construct (no re-validation);
+        JSON numbers are coerced explicitly where the model expects a float.
         """
         summary = None
         if row.get("title_zh"):
-            summary = PaperSummary(
+            summary = PaperSummary.model_construct(
                 title_zh=row["title_zh"],
                 abstract_zh=row.get("abstract_zh") or "",
                 key_points=json.loads(row.get("key_points") or "[]"),
-                relevance_score=row.get("relevance_score") or 0.0,
+                relevance_score=float(row.get("relevance_score") or 0.0),
                 deep_analysis=row.get("deep_analysis"),
+                deep_analysis_html=row.get("deep_analysis_html"),
             )
 
-        return Paper(
+        return Paper.model_construct(
             guid=row["guid"],
             arxiv_id=row["arxiv_id"],
             title=row["title"],
@@ -33,6 +33,7 @@ CREATE TABLE IF NOT EXISTS papers (
 
     -- PDF deep analysis
     deep_analysis TEXT,
+    deep_analysis_html TEXT,            -- deep_analysis rendered to HTML at write time
     deep_analysis_at TIMESTAMP,
 
     -- Notification status
@@ -52,6 +53,13 @@ CREATE INDEX IF NOT EXISTS idx_papers_published_at ON papers(published_at);
 CREATE INDEX IF NOT EXISTS idx_papers_is_notified ON papers(is_notified);
 CREATE INDEX IF NOT EXISTS idx_papers_fetched_at ON papers(fetched_at);
 
+-- Analysis task status: shared across API workers
+CREATE TABLE IF NOT EXISTS analysis_status (
+    arxiv_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,               -- processing/completed/cached/error: ...
+    expires_at INTEGER NOT NULL         -- Unix timestamp, stale entries are ignored
+);
+
 -- Feed configs table (optional, for database-driven config)
 CREATE TABLE IF NOT EXISTS feed_configs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -4,12 +4,21 @@ Provides async SQLite storage with deduplication and status tracking.
 """
 
 import json
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
 import aiosqlite
 
 from citeo.models.paper import Paper, PaperSummary
+from citeo.utils.json_utils import dumps_compact
+
+# Reason: WAL persists in the database file, but synchronous and temp_store are
+# per-connection settings, so they are applied on every connect. NORMAL is
+# durable under WAL and avoids an fsync per committed write.
+_CONNECTION_PRAGMAS = "PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;"
 
 
 class SQLitePaperStorage:
@@ -43,18 +52,34 @@ class SQLitePaperStorage:
         schema_path = Path(__file__).parent / "migrations" / "init_schema.sql"
         schema_sql = schema_path.read_text()
 
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
+            await db.execute("PRAGMA journal_mode=WAL")
             await db.executescript(schema_sql)
+
+            # Reason: CREATE TABLE IF NOT EXISTS doesn't add columns to
+            # databases created before deep_analysis_html existed
+            async with db.execute("PRAGMA table_info(papers)") as cursor:
+                columns = {row[1] for row in await cursor.fetchall()}
+            if "deep_analysis_html" not in columns:
+                await db.execute("ALTER TABLE papers ADD COLUMN deep_analysis_html TEXT")
+
             await db.commit()
 
         self._initialized = True
 
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Open a connection with the per-connection pragmas applied."""
+        async with aiosqlite.connect(self._db_path) as db:
+            await db.executescript(_CONNECTION_PRAGMAS)
+            yield db
+
     async def save_paper(self, paper: Paper) -> bool:
         """Save paper, returns True if new (not duplicate).
 
         Reason: Using INSERT OR IGNORE for atomic deduplication.
         """
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             cursor = await db.execute(
                 """
                 INSERT OR IGNORE INTO papers (
@@ -68,8 +93,8 @@ class SQLitePaperStorage:
                     paper.arxiv_id,
                     paper.title,
                     paper.abstract,
-                    json.dumps(paper.authors),
-                    json.dumps(paper.categories),
+                    dumps_compact(paper.authors),
+                    dumps_compact(paper.categories),
                     paper.announce_type,
                     paper.published_at.isoformat(),
                     paper.abs_url,
@@ -82,7 +107,7 @@ class SQLitePaperStorage:
 
     async def get_paper_by_guid(self, guid: str) -> Paper | None:
         """Get paper by GUID."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute("SELECT * FROM papers WHERE guid = ?", (guid,)) as cursor:
                 row = await cursor.fetchone()
@@ -92,7 +117,7 @@ class SQLitePaperStorage:
 
     async def get_paper_by_arxiv_id(self, arxiv_id: str) -> Paper | None:
         """Get paper by arXiv ID."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute("SELECT * FROM papers WHERE arxiv_id = ?", (arxiv_id,)) as cursor:
                 row = await cursor.fetchone()
@@ -104,18 +129,28 @@ class SQLitePaperStorage:
         self,
         start_date: datetime,
         end_date: datetime,
+        *,
+        sort_order: str = "desc",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[Paper]:
-        """Get papers within date range."""
-        async with aiosqlite.connect(self._db_path) as db:
+        """Get papers within date range, sorted and paginated in SQL."""
+        # Reason: ORDER BY direction can't be a bound parameter, so whitelist it
+        direction = "ASC" if sort_order == "asc" else "DESC"
+        sql = f"""
+            SELECT * FROM papers
+            WHERE published_at >= ? AND published_at <= ?
+            ORDER BY published_at {direction}
+            """
+        params: tuple[str | int, ...] = (start_date.isoformat(), end_date.isoformat())
+        if limit is not None or offset:
+            # Reason: SQLite requires LIMIT before OFFSET; -1 means no limit
+            sql += " LIMIT ? OFFSET ?"
+            params += (limit if limit is not None else -1, offset)
+
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
-            async with db.execute(
-                """
-                SELECT * FROM papers
-                WHERE published_at >= ? AND published_at <= ?
-                ORDER BY published_at DESC
-                """,
-                (start_date.isoformat(), end_date.isoformat()),
-            ) as cursor:
+            async with db.execute(sql, params) as cursor:
                 rows = await cursor.fetchall()
                 return [self._row_to_paper(row) for row in rows]
 
@@ -128,7 +163,7 @@ class SQLitePaperStorage:
 
         Reason: Efficient count query for pagination without loading all papers.
         """
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             async with db.execute(
                 """
                 SELECT COUNT(*) FROM papers
@@ -141,7 +176,7 @@ class SQLitePaperStorage:
 
     async def get_pending_papers(self) -> list[Paper]:
         """Get papers waiting for notification."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 """
@@ -155,7 +190,7 @@ class SQLitePaperStorage:
 
     async def mark_as_notified(self, guid: str) -> None:
         """Mark paper as notified."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 """
                 UPDATE papers
@@ -168,7 +203,7 @@ class SQLitePaperStorage:
 
     async def update_summary(self, guid: str, summary: PaperSummary) -> None:
         """Update paper's AI-generated summary."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 """
                 UPDATE papers
@@ -179,7 +214,7 @@ class SQLitePaperStorage:
                 (
                     summary.title_zh,
                     summary.abstract_zh,
-                    json.dumps(summary.key_points),
+                    dumps_compact(summary.key_points),
                     summary.relevance_score,
                     summary.generated_at.isoformat(),
                     datetime.utcnow().isoformat(),
@@ -188,16 +223,23 @@ class SQLitePaperStorage:
             )
             await db.commit()
 
-    async def update_deep_analysis(self, guid: str, analysis: str) -> None:
+    async def update_deep_analysis(
+        self,
+        guid: str,
+        analysis: str,
+        analysis_html: str | None = None,
+    ) -> None:
         """Update paper's deep analysis result."""
-        async with aiosqlite.connect(self._db_path) as db:
+        now = datetime.utcnow().isoformat()
+        async with self._connect() as db:
             await db.execute(
                 """
                 UPDATE papers
-                SET deep_analysis = ?, deep_analysis_at = ?, updated_at = ?
+                SET deep_analysis = ?, deep_analysis_html = ?,
+                    deep_analysis_at = ?, updated_at = ?
                 WHERE guid = ?
                 """,
-                (analysis, datetime.utcnow().isoformat(), datetime.utcnow().isoformat(), guid),
+                (analysis, analysis_html, now, now, guid),
             )
             await db.commit()
 
@@ -211,7 +253,7 @@ class SQLitePaperStorage:
         Reason: Used for manual daily task triggering to find papers
         fetched today, regardless of their publication date.
         """
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 """
@@ -238,7 +280,7 @@ class SQLitePaperStorage:
         batch_size = 500  # SQLite can handle much larger batches than D1
         now = datetime.utcnow().isoformat()
 
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             for i in range(0, len(guids), batch_size):
                 batch = guids[i : i + batch_size]
                 placeholders = ",".join("?" * len(batch))
@@ -252,23 +294,82 @@ class SQLitePaperStorage:
                 )
             await db.commit()
 
+    async def set_analysis_status(
+        self,
+        arxiv_id: str,
+        status: str,
+        ttl_seconds: int = 1800,
+    ) -> None:
+        """Record background analysis status (upsert).
+
+        Reason: Expired rows are purged whenever a task finishes so the table
+        stays bounded to recently analyzed papers.
+        """
+        now = int(time.time())
+        async with self._connect() as db:
+            await db.execute(
+                """
+                INSERT INTO analysis_status (arxiv_id, status, expires_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(arxiv_id) DO UPDATE SET
+                    status = excluded.status, expires_at = excluded.expires_at
+                """,
+                (arxiv_id, status, now + ttl_seconds),
+            )
+            if status != "processing":
+                await db.execute("DELETE FROM analysis_status WHERE expires_at <= ?", (now,))
+            await db.commit()
+
+    async def try_start_analysis(self, arxiv_id: str, ttl_seconds: int = 1800) -> bool:
+        """Acquire the processing marker in a single conditional upsert."""
+        now = int(time.time())
+        async with self._connect() as db:
+            cursor = await db.execute(
+                """
+                INSERT INTO analysis_status (arxiv_id, status, expires_at)
+                VALUES (?, 'processing', ?)
+                ON CONFLICT(arxiv_id) DO UPDATE SET
+                    status = excluded.status, expires_at = excluded.expires_at
+                WHERE analysis_status.status != 'processing'
+                    OR analysis_status.expires_at <= ?
+                """,
+                (arxiv_id, now + ttl_seconds, now),
+            )
+            await db.commit()
+            return cursor.rowcount > 0
+
+    async def get_analysis_status(self, arxiv_id: str) -> str | None:
+        """Get background analysis status, ignoring expired entries."""
+        async with self._connect() as db:
+            async with db.execute(
+                "SELECT status FROM analysis_status WHERE arxiv_id = ? AND expires_at > ?",
+                (arxiv_id, int(time.time())),
+            ) as cursor:
+                row = await cursor.fetchone()
+                return row[0] if row else None
+
     async def close(self) -> None:
         """Close storage (no-op for SQLite as we use connection per operation)."""
         pass
 
     def _row_to_paper(self, row: aiosqlite.Row) -> Paper:
-        """Convert database row to Paper object."""
+        """Convert database row to Paper object.
+
+        Reason: Rows were validated when the Paper was saved, so models are
+        rebuilt with model_construct and skip re-validation on every read.
+        """
         summary = None
         if row["title_zh"]:
-            summary = PaperSummary(
+            summary = PaperSummary.model_construct(
                 title_zh=row["title_zh"],
                 abstract_zh=row["abstract_zh"] or "",
                 key_points=json.loads(row["key_points"] or "[]"),
                 relevance_score=row["relevance_score"] or 0.0,
                 deep_analysis=row["deep_analysis"],
+                deep_analysis_html=row["deep_analysis_html"],
             )
 
-        return Paper(
+        return Paper.model_construct(
             guid=row["guid"],
             arxiv_id=row["arxiv_id"],
             title=row["title"],
@@ -1,11 +1,15 @@
 """Utils package."""
 
 from citeo.utils.http_client import create_http_client, fetch_url
+from citeo.utils.json_utils import dumps_compact
 from citeo.utils.logger import configure_logging, get_logger
+from citeo.utils.markdown_html import render_markdown_html
 
 __all__ = [
     "configure_logging",
     "get_logger",
     "create_http_client",
     "fetch_url",
+    "render_markdown_html",
+    "dumps_compact",
 ]
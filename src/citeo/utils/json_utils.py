@@ -0,0 +1,20 @@
+"""JSON encoding utilities."""
+
+import json
+
+# Reason: ensure_ascii=False keeps Chinese text as UTF-8 instead of \uXXXX
+# escapes, which are several times larger; one shared encoder avoids building
+# a JSONEncoder per call for the non-default options
+_compact_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_compact(obj: object) -> str:
+    """Serialize obj to compact, non-ASCII-escaped JSON.
+
+    Args:
+        obj: JSON-serializable value.
+
+    Returns:
+        JSON string without insignificant whitespace.
+    """
+    return _compact_encoder.encode(obj)
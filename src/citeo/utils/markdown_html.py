@@ -0,0 +1,54 @@
+"""Markdown to HTML rendering for deep analysis reports.
+
+Shared by the analysis writer (HTML is stored alongside the Markdown) and
+the public web view (fallback for rows stored before that).
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import markdown
+
+# Rendered HTML cache, keyed by SHA-256 of the Markdown source
+# Reason: Deep analysis text is static once generated, so repeat renders
+# shouldn't re-run the Markdown parser; keying by content means a regenerated
+# analysis naturally misses the stale entry.
+_ANALYSIS_HTML_CACHE_MAX = 4096
+_analysis_html_cache: OrderedDict[str, str] = OrderedDict()
+
+# Reason: markdown.markdown() builds a new Markdown object and re-registers
+# extensions on every call; one shared instance is reset between documents.
+# Markdown instances are not reentrant, so conversions are serialized.
+_MD = markdown.Markdown(
+    extensions=[
+        "fenced_code",  # ```code blocks```
+        "tables",  # | table | support |
+        "nl2br",  # Convert \n to <br>
+    ]
+)
+_md_lock = threading.Lock()
+
+
+def render_markdown_html(text: str) -> str:
+    """Convert deep analysis Markdown to HTML, memoized by content hash.
+
+    Args:
+        text: Deep analysis in Markdown format.
+
+    Returns:
+        Rendered HTML fragment.
+    """
+    key = hashlib.sha256(text.encode()).hexdigest()
+    cached = _analysis_html_cache.get(key)
+    if cached is not None:
+        _analysis_html_cache.move_to_end(key)
+        return cached
+
+    with _md_lock:
+        html: str = _MD.reset().convert(text)
+
+    _analysis_html_cache[key] = html
+    if len(_analysis_html_cache) > _ANALYSIS_HTML_CACHE_MAX:
+        _analysis_html_cache.popitem(last=False)
+    return html
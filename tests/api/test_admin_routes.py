@@ -138,6 +138,16 @@ def test_retry_summary_returns_500_when_ai_fails(monkeypatch) -> None:
     assert "summary crashed" in response.json()["detail"]
 
 
+def test_retry_summary_rejects_malformed_arxiv_id(monkeypatch) -> None:
+    storage = FakeStorage([])
+    app = build_full_app(monkeypatch, storage)
+
+    response = TestClient(app).post("/api/admin/papers/not-an-id/retry-summary")
+
+    assert response.status_code == 422
+    assert storage.summary_updates == []
+
+
 # --- Task 3: Retry analysis ---
 
 
@@ -0,0 +1,76 @@
+"""Tests for API middleware."""
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from citeo.api.middleware import RateLimitMiddleware, resolve_client_ip
+from citeo.auth.rate_limiter import InMemoryRateLimiter, RateLimitConfig
+
+
+def build_app(limiter: InMemoryRateLimiter, calls: list[str]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/view/{arxiv_id}")
+    async def view(arxiv_id: str) -> dict[str, str]:
+        calls.append(arxiv_id)
+        return {"arxiv_id": arxiv_id}
+
+    @app.get("/api/health")
+    async def health(request: Request) -> dict[str, str]:
+        return {"status": "ok", "client_ip": request.state.client_ip}
+
+    app.add_middleware(
+        RateLimitMiddleware, rules={"/api/view/": limiter}, trusted_proxies=["testclient"]
+    )
+    return app
+
+
+def test_rate_limit_rejects_before_handler() -> None:
+    limiter = InMemoryRateLimiter(RateLimitConfig(requests=2, window_seconds=60))
+    calls: list[str] = []
+    client = TestClient(build_app(limiter, calls))
+
+    statuses = [client.get("/api/view/2604.00001").status_code for _ in range(3)]
+    unrestricted = [client.get("/api/health").status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+    assert unrestricted == [200, 200, 200]
+    assert calls == ["2604.00001", "2604.00001"]
+
+
+def test_resolve_client_ip_only_trusts_forwarded_for_from_proxies() -> None:
+    headers = [(b"x-forwarded-for", b"203.0.113.7, 10.0.0.2")]
+    proxies = frozenset({"10.0.0.1", "10.0.0.2"})
+
+    via_proxy = {"client": ("10.0.0.1", 1234), "headers": headers}
+    direct = {"client": ("198.51.100.9", 1234), "headers": headers}
+
+    assert resolve_client_ip(via_proxy, proxies) == "203.0.113.7"
+    assert resolve_client_ip(direct, proxies) == "198.51.100.9"
+
+
+def test_client_ip_exposed_on_request_state() -> None:
+    limiter = InMemoryRateLimiter(RateLimitConfig(requests=2, window_seconds=60))
+    client = TestClient(build_app(limiter, []))
+
+    forwarded = client.get("/api/health", headers={"X-Forwarded-For": "203.0.113.7"})
+    direct = client.get("/api/health")
+
+    assert forwarded.json()["client_ip"] == "203.0.113.7"
+    assert direct.json()["client_ip"] == "testclient"
+
+
+def test_rate_limit_rejection_logged_once_per_period(monkeypatch) -> None:
+    from citeo.auth import rate_limiter
+
+    warnings: list[str] = []
+    monkeypatch.setattr(
+        rate_limiter.logger, "warning", lambda event, **kw: warnings.append(kw["identifier"])
+    )
+    limiter = InMemoryRateLimiter(RateLimitConfig(requests=1, window_seconds=60))
+    client = TestClient(build_app(limiter, []))
+
+    statuses = [client.get("/api/view/2604.00001").status_code for _ in range(4)]
+
+    assert statuses == [200, 429, 429, 429]
+    assert warnings == ["testclient"]
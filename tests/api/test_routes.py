@@ -0,0 +1,394 @@
+"""Tests for public paper API routes."""
+
+import os
+from datetime import datetime
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from citeo.api.routes import router
+from citeo.auth.dependencies import require_auth
+from citeo.auth.models import AuthUser
+from citeo.models.paper import Paper
+
+
+class FakeStorage:
+    def __init__(self, papers: list[Paper]):
+        self.papers = papers
+        self.lookups: list[str] = []
+        self.analysis_status: dict[str, str] = {}
+
+    async def get_paper_by_arxiv_id(self, arxiv_id: str):
+        self.lookups.append(arxiv_id)
+        return next((p for p in self.papers if p.arxiv_id == arxiv_id), None)
+
+    async def get_analysis_status(self, arxiv_id: str):
+        return self.analysis_status.get(arxiv_id)
+
+    async def set_analysis_status(self, arxiv_id: str, status: str, ttl_seconds: int = 1800):
+        self.analysis_status[arxiv_id] = status
+
+    async def try_start_analysis(self, arxiv_id: str, ttl_seconds: int = 1800):
+        if self.analysis_status.get(arxiv_id) == "processing":
+            return False
+        self.analysis_status[arxiv_id] = "processing"
+        return True
+
+    async def count_papers_by_date(self, start_date, end_date):
+        return len(self.papers)
+
+    async def get_papers_by_date(
+        self, start_date, end_date, *, sort_order="desc", limit=None, offset=0
+    ):
+        papers = sorted(self.papers, key=lambda p: p.published_at, reverse=(sort_order == "desc"))
+        return papers[offset : None if limit is None else offset + limit]
+
+
+def make_paper(arxiv_id: str, *, title: str) -> Paper:
+    return Paper(
+        guid=f"oai:arXiv.org:{arxiv_id}v1",
+        arxiv_id=arxiv_id,
+        title=title,
+        abstract="Test abstract",
+        authors=["Alice", "Bob"],
+        categories=["cs.AI"],
+        announce_type="new",
+        published_at=datetime(2026, 4, 16, 9, 0, 0),
+        abs_url=f"https://arxiv.org/abs/{arxiv_id}",
+        source_id="arxiv.cs.AI",
+        fetched_at=datetime(2026, 4, 16, 10, 0, 0),
+    )
+
+
+def build_app(monkeypatch, storage: FakeStorage) -> FastAPI:
+    from citeo.api import routes
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[require_auth] = lambda: AuthUser(
+        user_id="tester", auth_method="api_key"
+    )
+    monkeypatch.setattr(routes, "_storage", storage)
+    return app
+
+
+def test_get_paper_returns_paper(monkeypatch) -> None:
+    storage = FakeStorage([make_paper("2604.00001", title="Route Paper")])
+    app = build_app(monkeypatch, storage)
+
+    response = TestClient(app).get("/api/papers/2604.00001")
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "Route Paper"
+    assert response.json()["pdf_url"] == "https://arxiv.org/pdf/2604.00001.pdf"
+
+
+def test_malformed_arxiv_id_rejected_before_storage(monkeypatch) -> None:
+    storage = FakeStorage([])
+    app = build_app(monkeypatch, storage)
+
+    response = TestClient(app).get("/api/papers/not-an-id")
+
+    assert response.status_code == 422
+    assert storage.lookups == []
+
+
+def test_view_rejects_malformed_arxiv_id_with_400(monkeypatch) -> None:
+    storage = FakeStorage([])
+    app = build_app(monkeypatch, storage)
+
+    response = TestClient(app).get("/api/view/abc'--")
+
+    assert response.status_code == 400
+    assert storage.lookups == []
+
+
+def test_papers_by_date_serializes_sorted_page(monkeypatch) -> None:
+    older = make_paper("2604.00002", title="Older")
+    newer = make_paper("2604.00003", title="Newer")
+    newer.published_at = datetime(2026, 4, 16, 12, 0, 0)
+    storage = FakeStorage([older, newer])
+    app = build_app(monkeypatch, storage)
+
+    response = TestClient(app).get("/api/papers/by-date?date=2026-04-16&limit=1")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert body["count"] == 1
+    assert body["query_date"] == "2026-04-16"
+    assert body["papers"][0]["title"] == "Newer"
+    assert body["papers"][0]["published_at"] == "2026-04-16T12:00:00"
+    assert body["papers"][0]["has_summary"] is False
+
+
+class FakeNonceStorage:
+    def __init__(self):
+        self.used: set[str] = set()
+
+    async def try_consume_nonce(self, nonce: str, arxiv_id: str, platform: str) -> bool:
+        if nonce in self.used:
+            return False
+        self.used.add(nonce)
+        return True
+
+    async def reset_nonce(self, nonce: str) -> bool:
+        self.used.discard(nonce)
+        return True
+
+
+def test_trigger_analysis_rejects_replayed_url(monkeypatch) -> None:
+    from citeo.api import routes
+    from citeo.auth.signed_url import SignedURLGenerator
+
+    storage = FakeStorage([make_paper("2604.00004", title="Signed Paper")])
+    app = build_app(monkeypatch, storage)
+    generator = SignedURLGenerator("k" * 32, nonce_storage=FakeNonceStorage())
+    monkeypatch.setattr(routes, "get_url_generator", lambda: generator)
+
+    async def noop_analysis(**kwargs) -> None:
+        return None
+
+    monkeypatch.setattr(routes, "_run_analysis_background_with_platform", noop_analysis)
+
+    url = generator.generate_analysis_url("2604.00004", "telegram")
+    path = url[url.index("/api/") :]
+    client = TestClient(app)
+    first = client.get(path)
+    second = client.get(path)
+
+    assert first.json()["status"] == "processing"
+    assert second.status_code == 401
+    assert "nonce consumed" in second.json()["detail"]
+
+
+def test_health_check(monkeypatch) -> None:
+    app = build_app(monkeypatch, FakeStorage([]))
+
+    response = TestClient(app).get("/api/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "version": "0.1.0"}
+
+
+def test_analyze_dedups_in_flight_analysis(monkeypatch) -> None:
+    from citeo.api import routes
+
+    storage = FakeStorage([make_paper("2604.00005", title="Busy Paper")])
+    app = build_app(monkeypatch, storage)
+    scheduled: list[str] = []
+
+    async def record_analysis(arxiv_id: str, force: bool = False) -> None:
+        scheduled.append(arxiv_id)
+
+    monkeypatch.setattr(routes, "_run_analysis_background", record_analysis)
+    monkeypatch.setattr(routes, "_pdf_service", object())
+
+    client = TestClient(app)
+    first = client.post("/api/papers/2604.00005/analyze")
+    second = client.post("/api/papers/2604.00005/analyze")
+
+    assert first.json()["status"] == "processing"
+    assert second.json()["status"] == "processing"
+    assert scheduled == ["2604.00005"]
+    assert storage.analysis_status["2604.00005"] == "processing"
+
+
+def test_view_analysis_reuses_rendered_markdown(monkeypatch) -> None:
+    from citeo.models.paper import PaperSummary
+    from citeo.utils import markdown_html
+
+    paper = make_paper("2604.00006", title="Viewed Paper")
+    paper.summary = PaperSummary(
+        title_zh="标题", abstract_zh="摘要", key_points=[], deep_analysis="## Heading"
+    )
+    app = build_app(monkeypatch, FakeStorage([paper]))
+    monkeypatch.setattr(
+        markdown_html, "_analysis_html_cache", type(markdown_html._analysis_html_cache)()
+    )
+    calls: list[str] = []
+    original = markdown_html._MD.convert
+
+    def counting_convert(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(markdown_html._MD, "convert", counting_convert)
+
+    client = TestClient(app)
+    first = client.get("/api/view/2604.00006")
+    second = client.get("/api/view/2604.00006")
+
+    assert first.status_code == 200
+    assert "<h2>Heading</h2>" in second.text
+    assert calls == ["## Heading"]
+
+
+def test_view_analysis_prefers_stored_html(monkeypatch) -> None:
+    from citeo.models.paper import PaperSummary
+    from citeo.utils import markdown_html
+
+    paper = make_paper("2604.00010", title="Prerendered")
+    paper.summary = PaperSummary(
+        title_zh="标题",
+        abstract_zh="摘要",
+        key_points=[],
+        deep_analysis="## Heading",
+        deep_analysis_html="<p>stored html</p>",
+    )
+    app = build_app(monkeypatch, FakeStorage([paper]))
+
+    def fail_convert(text):
+        raise AssertionError("stored HTML should be used")
+
+    monkeypatch.setattr(markdown_html._MD, "convert", fail_convert)
+
+    response = TestClient(app).get("/api/view/2604.00010")
+
+    assert response.status_code == 200
+    assert "<p>stored html</p>" in response.text
+
+
+def test_view_analysis_honours_etag(monkeypatch) -> None:
+    from citeo.api import routes
+    from citeo.models.paper import PaperSummary
+
+    paper = make_paper("2604.00007", title="Cached View")
+    paper.summary = PaperSummary(
+        title_zh="标题", abstract_zh="摘要", key_points=[], deep_analysis="First"
+    )
+    app = build_app(monkeypatch, FakeStorage([paper]))
+    monkeypatch.setattr(routes, "_view_cache", type(routes._view_cache)())
+    client = TestClient(app)
+
+    first = client.get("/api/view/2604.00007")
+    etag = first.headers["etag"]
+    not_modified = client.get("/api/view/2604.00007", headers={"If-None-Match": etag})
+
+    paper.summary.deep_analysis = "Second"
+    changed = client.get("/api/view/2604.00007", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert "Second" in changed.text
+
+
+def test_view_and_export_share_paper_lookup(monkeypatch) -> None:
+    from citeo.api import routes
+    from citeo.models.paper import PaperSummary
+
+    paper = make_paper("2604.00008", title="Shared Lookup")
+    paper.summary = PaperSummary(
+        title_zh="标题", abstract_zh="摘要", key_points=[], deep_analysis="Body"
+    )
+    storage = FakeStorage([paper])
+    app = build_app(monkeypatch, storage)
+    monkeypatch.setattr(routes, "_paper_cache", type(routes._paper_cache)())
+    client = TestClient(app)
+
+    assert client.get("/api/view/2604.00008").status_code == 200
+    exported = client.get("/api/export/2604.00008")
+    assert exported.text.startswith("# 标题\n\n## Shared Lookup")
+    assert exported.headers["content-type"] == "text/markdown; charset=utf-8"
+    assert exported.headers["content-length"] == str(len(exported.content))
+    assert storage.lookups == ["2604.00008"]
+
+    routes.invalidate_paper_cache("2604.00008")
+    client.get("/api/export/2604.00008")
+    assert storage.lookups == ["2604.00008", "2604.00008"]
+
+
+def test_concurrent_paper_fetches_are_coalesced(monkeypatch) -> None:
+    import asyncio
+
+    from citeo.api import routes
+
+    class SlowStorage(FakeStorage):
+        async def get_paper_by_arxiv_id(self, arxiv_id: str):
+            await asyncio.sleep(0.01)
+            return await super().get_paper_by_arxiv_id(arxiv_id)
+
+    storage = SlowStorage([make_paper("2604.00009", title="Viral Paper")])
+    monkeypatch.setattr(routes, "_storage", storage)
+    monkeypatch.setattr(routes, "_paper_cache", type(routes._paper_cache)())
+
+    async def fetch_many():
+        return await asyncio.gather(*(routes._get_paper_cached("2604.00009") for _ in range(5)))
+
+    papers = asyncio.run(fetch_many())
+
+    assert {p.title for p in papers} == {"Viral Paper"}
+    assert storage.lookups == ["2604.00009"]
+    assert routes._paper_fetches == {}
+
+
+def test_invalidation_discards_in_flight_paper_fetch(monkeypatch) -> None:
+    import asyncio
+
+    from citeo.api import routes
+
+    class GatedStorage(FakeStorage):
+        def __init__(self, papers):
+            super().__init__(papers)
+            self.release = asyncio.Event()
+
+        async def get_paper_by_arxiv_id(self, arxiv_id: str):
+            paper = await super().get_paper_by_arxiv_id(arxiv_id)
+            await self.release.wait()
+            return paper
+
+    stale = make_paper("2604.00010", title="Before update")
+    storage = GatedStorage([stale])
+    monkeypatch.setattr(routes, "_storage", storage)
+    monkeypatch.setattr(routes, "_paper_cache", type(routes._paper_cache)())
+    monkeypatch.setattr(routes, "_paper_fetches", {})
+
+    async def scenario():
+        first = asyncio.ensure_future(routes._get_paper_cached("2604.00010"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        routes.invalidate_paper_cache("2604.00010")
+        storage.papers = [make_paper("2604.00010", title="After update")]
+        second = asyncio.ensure_future(routes._get_paper_cached("2604.00010"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        storage.release.set()
+        return await first, await second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.title == "Before update"
+    assert second.title == "After update"
+    assert storage.lookups == ["2604.00010", "2604.00010"]
+    assert routes._paper_cache["2604.00010"][1].title == "After update"
+    assert routes._paper_fetches == {}
+
+
+def test_trigger_daily_task_uses_injected_paper_service(monkeypatch) -> None:
+    from citeo.api import routes
+
+    class FakePaperService:
+        async def trigger_daily_task(self, force: bool = False) -> dict:
+            return {
+                "status": "already_notified",
+                "papers_total": 3,
+                "papers_fetched": 0,
+                "papers_processed": 0,
+                "papers_notified": 0,
+            }
+
+    app = build_app(monkeypatch, FakeStorage([]))
+    client = TestClient(app)
+
+    unavailable = client.post("/api/daily-task/trigger")
+    app.dependency_overrides[routes.get_paper_service] = FakePaperService
+    triggered = client.post("/api/daily-task/trigger")
+
+    assert unavailable.status_code == 503
+    assert triggered.status_code == 200
+    assert triggered.json()["papers_total"] == 3
@@ -0,0 +1,47 @@
+"""Tests for the combined API key / JWT authenticator."""
+
+import asyncio
+import os
+from datetime import timedelta
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+
+import pytest
+
+from citeo.auth.combined import CombinedAuthenticator
+from citeo.auth.exceptions import TokenExpiredError
+from citeo.auth.jwt_auth import create_access_token
+
+API_KEY = "k" * 16
+SECRET = "s" * 32
+
+
+def test_api_key_only_request_skips_jwt(monkeypatch) -> None:
+    auth = CombinedAuthenticator(api_key=API_KEY, jwt_secret=SECRET)
+
+    async def fail_jwt(**kwargs):
+        raise AssertionError("JWT authenticator should not run")
+
+    monkeypatch.setattr(auth._jwt_auth, "authenticate", fail_jwt)
+
+    user = asyncio.run(auth.authenticate(api_key=API_KEY))
+
+    assert user is not None and user.auth_method == "api_key"
+    assert asyncio.run(auth.authenticate(api_key="wrong" * 4)) is None
+
+
+def test_expired_jwt_still_takes_precedence_over_api_key() -> None:
+    auth = CombinedAuthenticator(api_key=API_KEY, jwt_secret=SECRET)
+    expired = create_access_token(SECRET, expires_delta=timedelta(seconds=-10))
+
+    with pytest.raises(TokenExpiredError):
+        asyncio.run(auth.authenticate(api_key=API_KEY, bearer_token=expired))
+
+
+def test_api_key_authenticator_rejects_prefix_of_key() -> None:
+    from citeo.auth.api_key import APIKeyAuthenticator
+
+    auth = APIKeyAuthenticator(API_KEY)
+
+    assert asyncio.run(auth.authenticate(api_key=API_KEY)) is not None
+    assert asyncio.run(auth.authenticate(api_key=API_KEY[:-1])) is None
@@ -0,0 +1,57 @@
+"""Tests for JWT token utilities."""
+
+import os
+from datetime import timedelta
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+
+import jwt
+import pytest
+
+from citeo.auth import jwt_auth
+from citeo.auth.exceptions import TokenExpiredError
+from citeo.auth.jwt_auth import create_access_token, decode_token
+
+SECRET = "s" * 32
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache(monkeypatch):
+    monkeypatch.setattr(jwt_auth, "_token_cache", type(jwt_auth._token_cache)())
+
+
+def test_decode_token_caches_valid_tokens(monkeypatch) -> None:
+    token = create_access_token(SECRET, subject="alice")
+    calls = []
+    original = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(jwt_auth.jwt, "decode", counting_decode)
+
+    first = decode_token(token, SECRET)
+    second = decode_token(token, SECRET)
+
+    assert first is not None and first.sub == "alice"
+    assert second == first
+    assert len(calls) == 1
+    assert decode_token(token, "x" * 32) is None
+
+
+def test_decode_token_cached_entry_expires(monkeypatch) -> None:
+    token = create_access_token(SECRET, expires_delta=timedelta(seconds=30))
+    assert decode_token(token, SECRET) is not None
+
+    real_time = jwt_auth.time.time
+    monkeypatch.setattr(jwt_auth.time, "time", lambda: real_time() + 60)
+
+    with pytest.raises(TokenExpiredError):
+        decode_token(token, SECRET)
+
+
+def test_decode_token_requires_standard_claims() -> None:
+    token = jwt.encode({"sub": "alice", "exp": 4102444800}, SECRET, algorithm="HS256")
+
+    assert decode_token(token, SECRET) is None
@@ -0,0 +1,45 @@
+"""Tests for the in-memory rate limiter."""
+
+import pytest
+
+from citeo.auth import rate_limiter
+from citeo.auth.exceptions import RateLimitExceededError
+from citeo.auth.rate_limiter import InMemoryRateLimiter, RateLimitConfig
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_bucketed_window_expires_oldest_bucket(clock) -> None:
+    limiter = InMemoryRateLimiter(RateLimitConfig(requests=2, window_seconds=60, buckets=6))
+
+    limiter.check_rate_limit("ip")
+    clock[0] += 25
+    limiter.check_rate_limit("ip")
+    assert limiter.get_remaining("ip") == 0
+
+    with pytest.raises(RateLimitExceededError) as exc:
+        limiter.check_rate_limit("ip")
+    # First hit landed in bucket [1000, 1010), which leaves the window at 1060
+    assert exc.value.retry_after == 36
+
+    clock[0] += 35
+    limiter.check_rate_limit("ip")
+    assert limiter.get_remaining("ip") == 0
+
+    clock[0] += 60
+    assert limiter.get_remaining("ip") == 2
+
+
+def test_idle_identifiers_are_swept(clock) -> None:
+    limiter = InMemoryRateLimiter(RateLimitConfig(requests=2, window_seconds=60))
+
+    limiter.check_rate_limit("one-off")
+    clock[0] += 120
+    limiter.check_rate_limit("regular")
+
+    assert set(limiter._buckets) == {"regular"}
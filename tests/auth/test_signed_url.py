@@ -0,0 +1,127 @@
+"""Tests for signed URL generation, verification and nonce storage."""
+
+import base64
+import hashlib
+import hmac
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+
+from citeo.auth.signed_url import NonceStorage, SignedURLGenerator
+
+
+async def test_nonce_roundtrip_reuses_one_connection(temp_db_path) -> None:
+    storage = NonceStorage(str(temp_db_path))
+    try:
+        assert await storage.try_consume_nonce("n-1", "2604.00001", "telegram")
+        conn = storage._conn
+
+        assert not await storage.try_consume_nonce("n-1", "2604.00001", "telegram")
+        assert await storage.reset_nonce("n-1")
+        assert await storage.try_consume_nonce("n-1", "2604.00001", "telegram")
+
+        assert storage._conn is conn
+        async with conn.execute("PRAGMA journal_mode") as cursor:
+            assert (await cursor.fetchone())[0] == "wal"
+    finally:
+        await storage.close()
+
+    assert storage._conn is None
+
+
+class RecordingNonceStorage:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def try_consume_nonce(self, nonce: str, arxiv_id: str, platform: str) -> bool:
+        self.calls.append(nonce)
+        return True
+
+
+async def test_verify_url_checks_signature_before_nonce_storage() -> None:
+    storage = RecordingNonceStorage()
+    generator = SignedURLGenerator("k" * 32, nonce_storage=storage)
+    timestamp = int(time.time())
+
+    forged = await generator.verify_url("2604.00001", "telegram", timestamp, "n-1", "0" * 64)
+    signature = generator._compute_signature("2604.00001", "telegram", timestamp, "n-2")
+    genuine = await generator.verify_url("2604.00001", "telegram", timestamp, "n-2", signature)
+
+    assert forged.error == "Invalid signature"
+    assert genuine.valid
+    assert storage.calls == ["n-2"]
+
+
+def test_signature_is_truncated_base64url_hmac() -> None:
+    generator = SignedURLGenerator("k" * 32)
+
+    signature = generator._compute_signature("2604.00001", "feishu", 1700000000, "n-1", "bot")
+    digest = hmac.new(b"k" * 32, b"2604.00001|feishu|1700000000|n-1|bot", hashlib.sha256).digest()
+
+    assert signature == base64.urlsafe_b64encode(digest[:16]).rstrip(b"=").decode()
+    assert len(signature) == 22
+
+
+async def test_verify_url_accepts_legacy_hex_signature() -> None:
+    generator = SignedURLGenerator("k" * 32, nonce_storage=RecordingNonceStorage())
+    timestamp = int(time.time())
+    legacy = hmac.new(
+        b"k" * 32, f"2604.00001|telegram|{timestamp}|n-1".encode(), hashlib.sha256
+    ).hexdigest()
+
+    result = await generator.verify_url("2604.00001", "telegram", timestamp, "n-1", legacy)
+
+    assert result.valid
+
+
+async def test_generated_url_verifies() -> None:
+    generator = SignedURLGenerator("k" * 32, nonce_storage=RecordingNonceStorage())
+
+    url = generator.generate_analysis_url("2604.00001", "telegram")
+    params = dict(part.split("=", 1) for part in url.split("?", 1)[1].split("&"))
+
+    assert len(params["nonce"]) == 22
+    result = await generator.verify_url(
+        "2604.00001", "telegram", int(params["timestamp"]), params["nonce"], params["signature"]
+    )
+    assert result.valid
+
+
+async def test_cleanup_deletes_expired_nonces_in_batches(temp_db_path, monkeypatch) -> None:
+    from citeo.auth import signed_url
+
+    monkeypatch.setattr(signed_url, "_CLEANUP_BATCH_SIZE", 2)
+    storage = NonceStorage(str(temp_db_path))
+    try:
+        for i in range(5):
+            assert await storage.try_consume_nonce(f"old-{i}", "2604.00001", "telegram")
+        assert await storage.try_consume_nonce("fresh", "2604.00001", "telegram")
+        await storage._conn.execute(
+            "UPDATE signed_url_nonces SET created_at = 0 WHERE nonce LIKE 'old-%'"
+        )
+        await storage._conn.commit()
+
+        assert await storage.cleanup_expired_nonces() == 5
+        assert not await storage.try_consume_nonce("fresh", "2604.00001", "telegram")
+        assert await storage.try_consume_nonce("old-0", "2604.00001", "telegram")
+    finally:
+        await storage.close()
+
+
+def test_generated_url_encodes_query_parameters() -> None:
+    generator = SignedURLGenerator("k" * 32, base_url="https://citeo.example/")
+
+    url = generator.generate_analysis_url("2604.00001", "feishu", notifier_id="team a&b")
+
+    assert url.startswith("https://citeo.example/api/papers/trigger-analysis?arxiv_id=2604.00001&")
+    assert url.endswith("&notifier_id=team+a%26b")
+
+
+def test_generate_rejects_unknown_platform() -> None:
+    generator = SignedURLGenerator("k" * 32)
+
+    with pytest.raises(ValueError, match="Invalid platform"):
+        generator.generate_analysis_url("2604.00001", "slack")
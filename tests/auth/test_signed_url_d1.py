@@ -0,0 +1,45 @@
+"""Tests for D1 nonce storage."""
+
+import json
+
+import httpx
+
+from citeo.auth.signed_url_d1 import D1NonceStorage
+
+
+async def test_table_initialized_once_in_single_request() -> None:
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content)["sql"])
+        return httpx.Response(200, json={"success": True, "result": [{"meta": {"changes": 1}}]})
+
+    storage = D1NonceStorage("account", "database", "token")
+    storage._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        assert await storage.try_consume_nonce("n-1", "2604.00001", "telegram")
+        assert await storage.try_consume_nonce("n-2", "2604.00001", "telegram")
+    finally:
+        await storage.close()
+
+    assert len(requests) == 3
+    assert "CREATE TABLE" in requests[0] and "CREATE INDEX" in requests[0]
+    assert all("INSERT OR IGNORE" in sql for sql in requests[1:])
+
+
+async def test_replayed_nonce_rejected_without_request() -> None:
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content)["sql"])
+        return httpx.Response(200, json={"success": True, "result": [{"meta": {"changes": 1}}]})
+
+    storage = D1NonceStorage("account", "database", "token")
+    storage._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        assert await storage.try_consume_nonce("n-1", "2604.00001", "telegram")
+        assert not await storage.try_consume_nonce("n-1", "2604.00001", "telegram")
+    finally:
+        await storage.close()
+
+    assert len(requests) == 2
@@ -0,0 +1,49 @@
+"""Tests for refresh token storage."""
+
+from datetime import UTC, datetime, timedelta
+
+from citeo.auth.token_storage import InMemoryTokenStorage
+
+
+async def test_revoke_and_cleanup_lifecycle() -> None:
+    storage = InMemoryTokenStorage()
+    now = datetime.now(UTC)
+    await storage.store_refresh_token("a1", "alice", now + timedelta(days=7))
+    await storage.store_refresh_token("a2", "alice", now + timedelta(days=7))
+    await storage.store_refresh_token("b1", "bob", now + timedelta(days=7))
+    await storage.store_refresh_token("b2", "bob", now - timedelta(seconds=1))
+
+    assert await storage.is_token_valid("a1")
+    assert not await storage.is_token_valid("b2")
+    assert not await storage.is_token_valid("missing")
+
+    assert await storage.revoke_token("a1")
+    assert await storage.revoke_user_tokens("alice") == 1
+    assert not await storage.is_token_valid("a2")
+    assert await storage.is_token_valid("b1")
+
+    assert await storage.cleanup_expired() == 1
+    assert storage.get_token_count() == 3
+    assert storage.get_user_token_count("bob") == 1
+
+
+async def test_user_index_tracks_cleanup() -> None:
+    storage = InMemoryTokenStorage()
+    expired = datetime.now(UTC) - timedelta(seconds=1)
+    await storage.store_refresh_token("c1", "carol", expired)
+
+    assert storage.get_user_token_count("carol") == 1
+    assert await storage.cleanup_expired() == 1
+    assert storage._by_user == {}
+    assert await storage.revoke_user_tokens("carol") == 0
+
+
+async def test_cleanup_only_visits_expired_buckets() -> None:
+    storage = InMemoryTokenStorage()
+    now = datetime.now(UTC)
+    await storage.store_refresh_token("old", "dave", now - timedelta(hours=3))
+    await storage.store_refresh_token("new", "dave", now + timedelta(hours=3))
+
+    assert await storage.cleanup_expired() == 1
+    assert list(storage._expiry_buckets.values()) == [{"new"}]
+    assert await storage.is_token_valid("new")
@@ -0,0 +1,139 @@
+"""Tests for the Feishu notifier."""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+
+import httpx
+
+from citeo.models.paper import Paper, PaperSummary
+from citeo.notifiers.feishu import FeishuNotifier
+
+_real_sleep = asyncio.sleep
+
+
+def make_notifier(requests: list[dict], latency: float = 0) -> FeishuNotifier:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await _real_sleep(latency)
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json={"code": 0})
+
+    notifier = FeishuNotifier("https://open.feishu.cn/hook/abc", secret="s3cret")
+    notifier._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return notifier
+
+
+async def test_requests_reuse_one_client() -> None:
+    requests: list[dict] = []
+    notifier = make_notifier(requests)
+    client = notifier._client
+
+    assert await notifier.send_message("one")
+    assert await notifier.send_message("two")
+
+    assert notifier._client is client
+    assert [r["content"]["text"] for r in requests] == ["one", "two"]
+    assert all(r["sign"] for r in requests)
+
+    await notifier.close()
+    assert client.is_closed
+    assert notifier._client is None
+
+
+def make_paper(i: int = 0) -> Paper:
+    return Paper(
+        guid=f"oai:arXiv.org:2604.0000{i}v1",
+        arxiv_id=f"2604.0000{i}",
+        title=f"Paper {i}",
+        abstract="Test abstract",
+        authors=["Alice", "Bob", "Carol", "Dave"],
+        categories=["cs.AI", "cs.CL", "cs.LG", "stat.ML"],
+        published_at="2026-04-16T09:00:00",
+        abs_url=f"https://arxiv.org/abs/2604.0000{i}",
+        source_id="arxiv.cs.AI",
+    )
+
+
+async def test_send_papers_counts_round_trip_toward_rate_limit(monkeypatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    requests: list[dict] = []
+    notifier = make_notifier(requests, latency=0.05)
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    papers = [make_paper(i) for i in range(3)]
+
+    assert await notifier.send_papers(papers) == 3
+
+    assert len(requests) == 4
+    assert len(sleeps) == 3
+    assert all(0 < delay < 0.46 for delay in sleeps)
+    await notifier.close()
+
+
+def test_sign_matches_feishu_scheme() -> None:
+    notifier = FeishuNotifier("https://open.feishu.cn/hook/abc", secret="s3cret")
+
+    string_to_sign = b"1700000000\ns3cret"
+    expected = hmac.new(string_to_sign, digestmod=hashlib.sha256).digest()
+
+    assert notifier._generate_sign(1700000000) == base64.b64encode(expected).decode()
+    assert FeishuNotifier("https://open.feishu.cn/hook/abc")._generate_sign(1700000000) == ""
+
+
+def test_paper_card_layout() -> None:
+    paper = make_paper()
+    paper.summary = PaperSummary(
+        title_zh="论文标题",
+        abstract_zh="中文摘要",
+        key_points=["first", "second"],
+        relevance_score=8.5,
+    )
+
+    card = FeishuNotifier("https://open.feishu.cn/hook/abc")._build_paper_card(paper)
+    contents = [e.get("content") for e in card["elements"]]
+    buttons = card["elements"][-1]["actions"]
+
+    assert card["header"]["title"]["content"] == "论文标题"
+    assert contents == [
+        "*Paper 0*",
+        "👤 Alice, Bob, Carol 等 (4人)\n`cs.AI` `cs.CL` `cs.LG`",
+        None,
+        "中文摘要",
+        None,
+        "**📌 要点:**\n• first\n• second",
+        "🔥 推荐度: 8.5/10",
+        None,
+        None,
+    ]
+    assert [b["text"]["content"] for b in buttons] == ["📄 Abstract", "📥 PDF"]
+    assert buttons[1]["url"] == "https://arxiv.org/pdf/2604.00000.pdf"
+
+
+async def test_payload_sent_as_compact_utf8_json() -> None:
+    bodies: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return httpx.Response(200, json={"code": 0})
+
+    notifier = FeishuNotifier("https://open.feishu.cn/hook/abc")
+    notifier._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await notifier.send_message("今日新论文")
+
+    assert bodies == ['{"msg_type":"text","content":{"text":"今日新论文"}}'.encode()]
+    await notifier.close()
+
+
+def test_paper_card_without_categories_has_no_empty_tags() -> None:
+    paper = make_paper()
+    paper.categories = []
+
+    card = FeishuNotifier("https://open.feishu.cn/hook/abc")._build_paper_card(paper)
+
+    assert card["elements"][0]["content"] == "👤 Alice, Bob, Carol 等 (4人)\n"
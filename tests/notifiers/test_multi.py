@@ -0,0 +1,63 @@
+"""Tests for the multi-channel notifier."""
+
+import asyncio
+
+import pytest
+
+from citeo.notifiers.multi import MultiNotifier
+from citeo.notifiers.telegram import TelegramNotifier
+
+
+class SlowTelegram(TelegramNotifier):
+    def __init__(self, other_started: asyncio.Event):
+        self._other_started = other_started
+
+    async def send_papers(self, papers, total_filtered_count=None) -> int:
+        # Only finishes once the other platform has started sending
+        await self._other_started.wait()
+        return len(papers)
+
+
+class FakeFeishu:
+    def __init__(self, started: asyncio.Event):
+        self._started = started
+
+    async def send_papers(self, papers, total_filtered_count=None) -> int:
+        self._started.set()
+        return len(papers) - 1
+
+
+async def test_send_papers_runs_telegram_alongside_other_platforms() -> None:
+    started = asyncio.Event()
+    notifier = MultiNotifier([SlowTelegram(started), FakeFeishu(started)])
+
+    sent = await asyncio.wait_for(notifier.send_papers(["a", "b"]), timeout=1)
+
+    assert sent == 2
+
+
+class CancelledTelegram(TelegramNotifier):
+    def __init__(self):
+        pass
+
+    async def send_papers(self, papers, total_filtered_count=None) -> int:
+        raise asyncio.CancelledError
+
+
+class FailingFeishu:
+    async def send_papers(self, papers, total_filtered_count=None) -> int:
+        raise RuntimeError("webhook down")
+
+
+async def test_send_papers_tolerates_channel_failure() -> None:
+    started = asyncio.Event()
+    notifier = MultiNotifier([FakeFeishu(started), FailingFeishu()])
+
+    assert await notifier.send_papers(["a", "b"]) == 1
+
+
+async def test_send_papers_propagates_cancellation_from_telegram_chain() -> None:
+    notifier = MultiNotifier([CancelledTelegram(), FailingFeishu()])
+
+    with pytest.raises(asyncio.CancelledError):
+        await notifier.send_papers(["a"])
@@ -0,0 +1,35 @@
+"""Tests for the paper service."""
+
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+
+from citeo.models.paper import Paper, PaperSummary
+from citeo.parsers.arxiv_parser import ArxivParser
+from citeo.services.paper_service import PaperService
+
+
+class RecordingStorage:
+    def __init__(self):
+        self.notified: list[str] = []
+
+    async def mark_as_notified(self, guid: str) -> None:
+        self.notified.append(guid)
+
+
+async def test_notify_without_notifier_leaves_papers_pending() -> None:
+    storage = RecordingStorage()
+    service = PaperService(sources=[], parser=ArxivParser(), storage=storage, notifier=None)
+    paper = Paper(
+        guid="oai:arXiv.org:2604.00001v1",
+        arxiv_id="2604.00001",
+        title="Paper",
+        abstract="Test abstract",
+        published_at="2026-04-16T09:00:00",
+        abs_url="https://arxiv.org/abs/2604.00001",
+        source_id="arxiv.cs.AI",
+        summary=PaperSummary(title_zh="标题", abstract_zh="摘要", relevance_score=9),
+    )
+
+    assert await service._notify([paper]) == 0
+    assert storage.notified == []
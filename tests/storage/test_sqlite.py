@@ -0,0 +1,142 @@
+"""Tests for SQLite paper storage."""
+
+from datetime import datetime
+
+import aiosqlite
+
+from citeo.models.paper import Paper, PaperSummary
+from citeo.storage.sqlite import SQLitePaperStorage
+
+
+def make_paper(arxiv_id: str, published_at: datetime) -> Paper:
+    return Paper(
+        guid=f"oai:arXiv.org:{arxiv_id}v1",
+        arxiv_id=arxiv_id,
+        title=f"Paper {arxiv_id}",
+        abstract="Test abstract",
+        authors=["Alice"],
+        categories=["cs.AI"],
+        published_at=published_at,
+        abs_url=f"https://arxiv.org/abs/{arxiv_id}",
+        source_id="arxiv.cs.AI",
+    )
+
+
+async def test_get_papers_by_date_sorts_and_paginates(temp_db_path) -> None:
+    storage = SQLitePaperStorage(temp_db_path)
+    await storage.initialize()
+    for hour, arxiv_id in [(9, "2604.00001"), (11, "2604.00002"), (10, "2604.00003")]:
+        await storage.save_paper(make_paper(arxiv_id, datetime(2026, 4, 16, hour)))
+
+    start, end = datetime(2026, 4, 16), datetime(2026, 4, 17)
+
+    desc_page = await storage.get_papers_by_date(start, end, limit=2)
+    asc_page = await storage.get_papers_by_date(start, end, sort_order="asc", limit=2, offset=1)
+    everything = await storage.get_papers_by_date(start, end)
+
+    assert [p.arxiv_id for p in desc_page] == ["2604.00002", "2604.00003"]
+    assert [p.arxiv_id for p in asc_page] == ["2604.00003", "2604.00002"]
+    assert len(everything) == 3
+    assert await storage.count_papers_by_date(start, end) == 3
+
+
+async def test_analysis_status_roundtrip_and_expiry(temp_db_path) -> None:
+    storage = SQLitePaperStorage(temp_db_path)
+    await storage.initialize()
+
+    assert await storage.get_analysis_status("2604.00001") is None
+
+    await storage.set_analysis_status("2604.00001", "processing")
+    await storage.set_analysis_status("2604.00001", "completed")
+    await storage.set_analysis_status("2604.00002", "processing", ttl_seconds=-1)
+
+    assert await storage.get_analysis_status("2604.00001") == "completed"
+    assert await storage.get_analysis_status("2604.00002") is None
+
+
+async def test_finished_analysis_purges_expired_status_rows(temp_db_path) -> None:
+    storage = SQLitePaperStorage(temp_db_path)
+    await storage.initialize()
+
+    await storage.set_analysis_status("2604.00001", "completed", ttl_seconds=-1)
+    await storage.set_analysis_status("2604.00002", "completed")
+
+    async with aiosqlite.connect(temp_db_path) as db:
+        async with db.execute("SELECT arxiv_id FROM analysis_status") as cursor:
+            rows = await cursor.fetchall()
+
+    assert [row[0] for row in rows] == ["2604.00002"]
+
+
+async def test_try_start_analysis_is_exclusive_until_finished(temp_db_path) -> None:
+    storage = SQLitePaperStorage(temp_db_path)
+    await storage.initialize()
+
+    assert await storage.try_start_analysis("2604.00001") is True
+    assert await storage.try_start_analysis("2604.00001") is False
+
+    await storage.set_analysis_status("2604.00001", "completed")
+    assert await storage.try_start_analysis("2604.00001") is True
+
+    await storage.try_start_analysis("2604.00002", ttl_seconds=-1)
+    assert await storage.try_start_analysis("2604.00002") is True
+
+
+async def test_initialize_adds_deep_analysis_html_to_legacy_db(temp_db_path) -> None:
+    from pathlib import Path
+
+    from citeo.models.paper import PaperSummary
+
+    schema = (
+        Path(__file__).parents[2] / "src/citeo/storage/migrations/init_schema.sql"
+    ).read_text()
+    legacy_schema = "\n".join(
+        line for line in schema.splitlines() if "deep_analysis_html" not in line
+    )
+    async with aiosqlite.connect(temp_db_path) as db:
+        await db.executescript(legacy_schema)
+        await db.commit()
+
+    storage = SQLitePaperStorage(temp_db_path)
+    await storage.initialize()
+    paper = make_paper("2604.00020", datetime(2026, 4, 16, 9))
+    await storage.save_paper(paper)
+    await storage.update_summary(
+        paper.guid, PaperSummary(title_zh="标题", abstract_zh="摘要", key_points=[])
+    )
+    await storage.update_deep_analysis(paper.guid, "## Heading", "<h2>Heading</h2>")
+
+    stored = await storage.get_paper_by_arxiv_id("2604.00020")
+
+    assert stored.summary.deep_analysis == "## Heading"
+    assert stored.summary.deep_analysis_html == "<h2>Heading</h2>"
+
+
+async def test_loaded_paper_matches_saved_paper(temp_db_path) -> None:
+    storage = SQLitePaperStorage(temp_db_path)
+    await storage.initialize()
+    paper = make_paper("2604.00009", datetime(2026, 4, 16, 9))
+    await storage.save_paper(paper)
+    summary = PaperSummary(title_zh="标题", abstract_zh="摘要", key_points=["a"], relevance_score=8)
+    await storage.update_summary(paper.guid, summary)
+
+    loaded = await storage.get_paper_by_guid(paper.guid)
+
+    expected = paper.model_dump(exclude={"summary"})
+    assert loaded.model_dump(exclude={"summary"}) == expected
+    assert loaded.summary.model_dump(exclude={"generated_at"}) == summary.model_dump(
+        exclude={"generated_at"}
+    )
+    await storage.close()
+
+
+async def test_initialize_switches_database_to_wal(temp_db_path) -> None:
+    storage = SQLitePaperStorage(temp_db_path)
+    await storage.initialize()
+
+    async with aiosqlite.connect(temp_db_path) as db:
+        async with db.execute("PRAGMA journal_mode") as cursor:
+            assert (await cursor.fetchone())[0] == "wal"
+    async with storage._connect() as db:
+        async with db.execute("PRAGMA synchronous") as cursor:
+            assert (await cursor.fetchone())[0] == 1